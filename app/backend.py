@@ -2,11 +2,14 @@ import os
 import pandas as pd
 import numpy as np
 import json
+import orjson
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import math
 import logging
+import threading
 
 # Import farmer-friendly messages
 from app.core.messages import (
@@ -18,6 +21,7 @@ from app.core.messages import (
 )
 
 from app.core.uncertainty import UncertaintyQuantifier
+from app.core.http_client import get_http_session
 from app.config import settings
 
 # Setup logging
@@ -29,6 +33,131 @@ RAINFALL_HISTORICAL = settings.RAINFALL_DATA_PATH
 WEATHER_DRIVERS = settings.WEATHER_DATA_PATH
 MODEL_CLASSIFIER = settings.DISTRICT_MODEL_PATH
 FEATURE_SCHEMA = settings.FEATURE_SCHEMA_PATH
+WEATHER_COLUMNS = ['temp', 'humidity', 'wind', 'pressure']
+
+# History is recorded to 0.01 (mm, °C, %, m/s, kPa): float32 storage halves the
+# per-taluk index, sums accumulate in float64 and values are rounded back to 2 dp
+HISTORY_DTYPE = np.float32
+
+def _read_history(csv_path):
+    """
+    Load a daily history table sorted once by (taluk, date).
+    Prefers a Parquet copy next to the CSV (see scripts/convert_to_parquet.py)
+    because it keeps the typed date column; falls back to the CSV when the
+    file or pyarrow is missing.
+    """
+    parquet_path = Path(csv_path).with_suffix('.parquet')
+    df = None
+    if parquet_path.exists():
+        try:
+            df = pd.read_parquet(parquet_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read {parquet_path.name}: {e}. Falling back to CSV.")
+    
+    if df is None:
+        # Typed read: taluk as a categorical (7 codes instead of one Python str
+        # per row), values straight to HISTORY_DTYPE. Dates are ISO 'YYYY-MM-DD'
+        # with an optional time part; they are converted in one vectorized pass
+        # afterwards because pandas drops to a slow path when dtype= and
+        # parse_dates= are combined.
+        header = pd.read_csv(csv_path, nrows=0).columns
+        dtypes = {col: HISTORY_DTYPE for col in header if col not in ('date', 'taluk')}
+        dtypes['taluk'] = 'category'
+        df = pd.read_csv(csv_path, engine='c', dtype=dtypes)
+        df['date'] = pd.to_datetime(df['date'], format='ISO8601')
+    
+    return df.sort_values(['taluk', 'date'], kind='stable', ignore_index=True)
+
+def _parse_reference_date(value):
+    """
+    Request date as a pd.Timestamp. ISO strings go through the C-level
+    datetime.fromisoformat (~1 us vs ~200 us for pd.to_datetime on one string);
+    anything else keeps the old pandas parsing.
+    """
+    if isinstance(value, str):
+        try:
+            return pd.Timestamp(datetime.fromisoformat(value))
+        except ValueError:
+            pass
+    return pd.to_datetime(value)
+
+def _load_model_file(pkl_path):
+    """
+    Load a pickled model. Prefers a .joblib sibling (see
+    scripts/convert_models_to_joblib.py) opened with mmap_mode='r', so the
+    tree arrays are paged in from the file and shared between worker processes.
+    """
+    joblib_path = Path(pkl_path).with_suffix('.joblib')
+    if joblib_path.exists():
+        try:
+            import joblib
+            return joblib.load(joblib_path, mmap_mode='r')
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load {joblib_path.name} ({e}); using pickle")
+    
+    with open(pkl_path, 'rb') as f:
+        return pickle.load(f)
+
+def _prefix_sums(rain):
+    """Running totals with a leading 0: prefix[k] == rain[:k].sum() (float64)"""
+    return np.concatenate(([0.0], np.cumsum(rain, dtype=np.float64)))
+
+def _rain_window_features(rain, prefix):
+    """
+    Lag/rolling features from daily rainfall before the reference date
+    (oldest first, at least 30 days) and its prefix sums:
+    (lag_7, lag_30, sum_30, sum_60, sum_90, dry_days)
+    """
+    last_30_days = rain[-30:]
+    # Any trailing window is two prefix lookups
+    # (shorter history -> sum of everything available)
+    n = len(rain)
+    total = prefix[n]
+    sum_30 = float(total - prefix[max(0, n - 30)])
+    sum_60 = float(total - prefix[max(0, n - 60)])
+    sum_90 = float(total - prefix[max(0, n - 90)])
+    return (
+        round(float(last_30_days[-7]), 2),
+        round(float(last_30_days[0]), 2),
+        round(sum_30, 2),
+        # Drought-specific features
+        round(sum_60, 2),
+        round(sum_90, 2),
+        int(np.count_nonzero(last_30_days < 2))  # Days with < 2mm rain
+    )
+
+# Index entries for a taluk with no history
+_NO_RAIN = (np.array([], dtype='datetime64[ns]'), np.array([], dtype=HISTORY_DTYPE), np.zeros(1))
+_NO_WEATHER = (np.array([], dtype='datetime64[ns]'), np.empty((0, len(WEATHER_COLUMNS)), dtype=HISTORY_DTYPE))
+
+def _nearest_center(lat, lon, centers):
+    """
+    Single-pass haversine + argmin over packed (lat_rad, lon_rad, cos_lat, name) centers.
+    Returns: (distance_km, name) of the closest center
+    """
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    cos_lat = math.cos(lat_r)
+    sin, asin, sqrt = math.sin, math.asin, math.sqrt
+
+    best_a, best_name = 2.0, None  # a is in [0, 1]
+    for c_lat, c_lon, c_cos, name in centers:
+        a = sin((c_lat - lat_r) / 2)**2 + cos_lat * c_cos * sin((c_lon - lon_r) / 2)**2
+        if a < best_a:
+            best_a, best_name = a, name
+    # haversine is monotonic in a, so take asin/sqrt only for the winner
+    return 6371 * 2 * asin(sqrt(best_a)), best_name
+
+def _feature_matrix(features_list, feature_order):
+    """
+    Schema-ordered (n_requests, n_features) matrix, built without intermediate lists.
+    float32 because sklearn trees split on float32 anyway, so predict_proba skips a copy.
+    """
+    X = np.empty((len(features_list), len(feature_order)), dtype=np.float32)
+    for i, features in enumerate(features_list):
+        X[i] = np.fromiter((features[f] for f in feature_order), dtype=np.float32,
+                           count=len(feature_order))
+    return X
 
 # ==================== CUSTOM EXCEPTIONS ====================
 class GPSOutOfBoundsError(Exception):
@@ -45,14 +174,51 @@ class InvalidDateError(Exception):
 
 # ==================== B1: GPS → TALUK MAPPER ====================
 class TalukMapper:
-    def __init__(self):
+    _instance = None
+    _lock = threading.Lock()
+    _boundaries = None
+    _bboxes = ()
+    _centers = ()
+    _arrays = None  # column arrays of the same bboxes/centers for get_taluks_batch
+    
+    def __new__(cls):
+        """Singleton pattern: only create one instance (first load is thread-safe)"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._load_boundaries()
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+    
+    @classmethod
+    def _load_boundaries(cls):
+        """Load taluk boundaries once and cache in memory"""
+        if cls._boundaries is not None:
+            return  # Already loaded
+        
         try:
-            with open(TALUK_BOUNDARIES, 'r') as f:
-                self.boundaries = json.load(f)
+            with open(TALUK_BOUNDARIES, 'rb') as f:
+                cls._boundaries = orjson.loads(f.read())
         except FileNotFoundError:
             raise RuntimeError("Taluk boundaries file not found. System configuration error.")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise RuntimeError("Taluk boundaries file is corrupted.")
+        
+        # Pack bboxes and centers into flat tuples once so lookups skip the dict walks
+        taluks = [(data['name'].lower(), data['bbox'], data['center']) for data in cls._boundaries.values()]
+        cls._bboxes = tuple((b['min_lat'], b['max_lat'], b['min_lon'], b['max_lon'], name)
+                            for name, b, _ in taluks)
+        # Centers stored in radians with cos(lat) precomputed for _nearest_center
+        cls._centers = tuple((math.radians(c['lat']), math.radians(c['lon']),
+                              math.cos(math.radians(c['lat'])), name) for name, _, c in taluks)
+        # Same data as (1, n_taluks) rows so a batch of points broadcasts against it
+        bbox = np.array([b[:4] for b in cls._bboxes], dtype=np.float64).T[:, None, :]
+        centers = np.array([c[:3] for c in cls._centers], dtype=np.float64).T[:, None, :]
+        cls._arrays = (*bbox, *centers, np.array([c[3] for c in cls._centers], dtype=object))
+    
+    @property
+    def boundaries(self):
+        return self._boundaries
     
     def get_taluk(self, lat, lon):
         """
@@ -71,23 +237,13 @@ class TalukMapper:
                 "This service only works for Udupi district farmers."
             )
         
-        # First, check if point is within any bbox
-        for taluk_id, data in self.boundaries.items():
-            bbox = data['bbox']
-            if (bbox['min_lat'] <= lat <= bbox['max_lat'] and 
-                bbox['min_lon'] <= lon <= bbox['max_lon']):
-                return data['name'].lower(), "high"
+        # First, check if point is within any bbox (first match wins)
+        for min_lat, max_lat, min_lon, max_lon, name in self._bboxes:
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
+                return name, "high"
         
         # If no bbox match, find nearest taluk center
-        min_dist = float('inf')
-        nearest_taluk = None
-        
-        for taluk_id, data in self.boundaries.items():
-            center = data['center']
-            dist = self._haversine(lat, lon, center['lat'], center['lon'])
-            if dist < min_dist:
-                min_dist = dist
-                nearest_taluk = data['name'].lower()
+        min_dist, nearest_taluk = _nearest_center(lat, lon, self._centers)
         
         # Reject if too far (>30km from any taluk center)
         if min_dist > 30:
@@ -98,33 +254,66 @@ class TalukMapper:
         
         confidence = "medium" if min_dist < 15 else "low"
         return nearest_taluk, confidence
-    
-    @staticmethod
-    def _haversine(lat1, lon1, lat2, lon2):
-        """Calculate distance in km between two GPS points."""
-        R = 6371  # Earth radius in km
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * 
-             math.sin(dlon/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
-        return R * c
+
+    def get_taluks_batch(self, lats, lons):
+        """
+        Vectorized get_taluk over N points: one broadcast bbox test and one
+        haversine + argmin across all (point, taluk) pairs.
+        Returns: list of (taluk_name, confidence), or the GPSOutOfBoundsError
+        for that point, in input order
+        """
+        lat = np.asarray(lats, dtype=np.float64)[:, None]
+        lon = np.asarray(lons, dtype=np.float64)[:, None]
+        min_lat, max_lat, min_lon, max_lon, c_lat, c_lon, c_cos, names = self._arrays
+        
+        # First matching bbox per point (argmax returns the first True)
+        hit = (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+        in_bbox = hit.any(axis=1)
+        bbox_idx = hit.argmax(axis=1)
+        
+        lat_r = np.radians(lat)
+        a = (np.sin((c_lat - lat_r) / 2)**2 +
+             np.cos(lat_r) * c_cos * np.sin((c_lon - np.radians(lon)) / 2)**2)
+        nearest = a.argmin(axis=1)
+        dist = 6371 * 2 * np.arcsin(np.sqrt(a[np.arange(len(a)), nearest]))
+        
+        lat, lon = lat[:, 0], lon[:, 0]
+        ok = (12.5 <= lat) & (lat <= 14.5) & (74.4 <= lon) & (lon <= 75.3) & (in_bbox | (dist <= 30))
+        
+        results = []
+        for i in range(len(lat)):
+            if not ok[i]:
+                # Rare path: let the scalar lookup produce the exact error
+                try:
+                    results.append(self.get_taluk(float(lat[i]), float(lon[i])))
+                except GPSOutOfBoundsError as e:
+                    results.append(e)
+            elif in_bbox[i]:
+                results.append((names[bbox_idx[i]], "high"))
+            else:
+                results.append((names[nearest[i]], "medium" if dist[i] < 15 else "low"))
+        return results
 
 # ==================== B2: FEATURE ENGINEERING ====================
 class FeatureEngineer:
     _instance = None
+    _lock = threading.Lock()
     _use_db = False
     _engine = None
     _rainfall_df = None
     _weather_df = None
+    _rain_index = None     # taluk -> (dates, rainfall, prefix sums of rainfall), date-sorted
+    _weather_index = None  # taluk -> (dates, [temp, humidity, wind, pressure]), date-sorted
+    _monthly_index = None  # taluk -> (years, (n_years, 12) monthly rainfall totals, NaN = no data)
     _schema = None
     
     def __new__(cls, db_url=None):
-        """Singleton pattern: only create one instance"""
+        """Singleton pattern: only create one instance (first load is thread-safe)"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._load_data(db_url)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._load_data(db_url)
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     @classmethod
@@ -153,10 +342,9 @@ class FeatureEngineer:
         if not cls._use_db:
             try:
                 logger.info("Loading CSV data (first time)...")
-                cls._rainfall_df = pd.read_csv(RAINFALL_HISTORICAL)
-                cls._rainfall_df['date'] = pd.to_datetime(cls._rainfall_df['date'], format='mixed')
-                cls._weather_df = pd.read_csv(WEATHER_DRIVERS)
-                cls._weather_df['date'] = pd.to_datetime(cls._weather_df['date'], format='mixed')
+                cls._rainfall_df = _read_history(RAINFALL_HISTORICAL)
+                cls._weather_df = _read_history(WEATHER_DRIVERS)
+                cls._build_index()
                 logger.info("✅ FeatureEngineer loaded and cached CSV data")
             except FileNotFoundError as e:
                 raise RuntimeError(f"Required data file not found: {e.filename}")
@@ -164,11 +352,38 @@ class FeatureEngineer:
                 raise RuntimeError(f"Error loading data files: {str(e)}")
             
         try:
-            with open(FEATURE_SCHEMA, 'r') as f:
-                cls._schema = json.load(f)
+            with open(FEATURE_SCHEMA, 'rb') as f:
+                cls._schema = orjson.loads(f.read())
         except Exception as e:
             raise RuntimeError(f"Error loading schema: {str(e)}")
     
+    @classmethod
+    def _build_index(cls):
+        """
+        Split the (taluk, date)-sorted frames into per-taluk NumPy arrays so a
+        request is a binary search + slice instead of a full-frame mask and sort.
+        """
+        cls._rain_index = {}
+        for taluk, g in cls._rainfall_df.groupby('taluk', sort=False, observed=True):
+            rain = g['rainfall'].to_numpy(dtype=HISTORY_DTYPE)
+            cls._rain_index[taluk] = (g['date'].to_numpy(dtype='datetime64[ns]'), rain, _prefix_sums(rain))
+        cls._weather_index = {
+            taluk: (g['date'].to_numpy(dtype='datetime64[ns]'), g[WEATHER_COLUMNS].to_numpy(dtype=HISTORY_DTYPE))
+            for taluk, g in cls._weather_df.groupby('taluk', sort=False, observed=True)
+        }
+        # Monthly totals per (year, month) for the deficit baseline, in float64 like the
+        # old per-request groupby; min_count=1 keeps months without rows as NaN
+        dates = cls._rainfall_df['date']
+        monthly = (cls._rainfall_df['rainfall'].astype(np.float64)
+                   .groupby([cls._rainfall_df['taluk'], dates.dt.year, dates.dt.month], observed=True)
+                   .sum(min_count=1)
+                   .unstack())
+        monthly = monthly.reindex(columns=range(1, 13))
+        cls._monthly_index = {
+            taluk: (t.index.get_level_values(1).to_numpy(dtype=np.int64), t.to_numpy(dtype=np.float64))
+            for taluk, t in monthly.groupby(level=0, sort=False, observed=True)
+        }
+    
     @property
     def use_db(self):
         return self._use_db
@@ -190,42 +405,62 @@ class FeatureEngineer:
         return self._schema
 
     def _get_rainfall_data(self, taluk, ref_dt):
-        """Fetch rainfall data (historical) for feature computation"""
-        if self.use_db:
-            query = f"""
-                SELECT date, rainfall_mm as rainfall 
-                FROM rainfall_history 
-                WHERE taluk = '{taluk}' AND date < '{ref_dt.strftime('%Y-%m-%d')}'
-                ORDER BY date ASC
-            """
-            df = pd.read_sql(query, self.engine)
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-            return df
-        else:
-            return self.rainfall_df[
-                (self.rainfall_df['taluk'] == taluk) &
-                (self.rainfall_df['date'] < ref_dt)
-            ].sort_values('date')
+        """
+        Fetch the last 90 days of rainfall before ref_dt from the DB (oldest first).
+        CSV mode never comes here: it slices the per-taluk index built at load time.
+        """
+        # Newest-first + LIMIT walks idx_rainfall_taluk_date backwards instead of
+        # pulling the taluk's whole history; 90 days covers every rolling window
+        query = f"""
+            SELECT date, rainfall_mm as rainfall 
+            FROM rainfall_history 
+            WHERE taluk = '{taluk}' AND date < '{ref_dt.strftime('%Y-%m-%d')}'
+            ORDER BY date DESC
+            LIMIT 90
+        """
+        df = pd.read_sql(query, self.engine).iloc[::-1].reset_index(drop=True)
+        if not df.empty:
+            df['date'] = pd.to_datetime(df['date'])
+        return df
 
     def _get_weather_data(self, taluk, ref_dt):
-        """Fetch weather driver data"""
+        """Fetch the latest weather driver row on or before ref_dt from the DB"""
+        query = f"""
+            SELECT date, temp, humidity, wind, pressure
+            FROM weather_drivers
+            WHERE taluk = '{taluk}' AND date <= '{ref_dt.strftime('%Y-%m-%d')}'
+            ORDER BY date DESC
+            LIMIT 1
+        """
+        df = pd.read_sql(query, self.engine)
+        if not df.empty:
+            df['date'] = pd.to_datetime(df['date'])
+        return df
+
+    def _rain_before(self, taluk, ref_dt):
+        """
+        Daily rainfall strictly before ref_dt, oldest first, and its prefix sums
+        (NumPy arrays of length n and n + 1)
+        """
         if self.use_db:
-            query = f"""
-                SELECT date, temp, humidity, wind, pressure
-                FROM weather_drivers
-                WHERE taluk = '{taluk}' AND date <= '{ref_dt.strftime('%Y-%m-%d')}'
-                ORDER BY date ASC
-            """
-            df = pd.read_sql(query, self.engine)
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-            return df
-        else:
-            return self.weather_df[
-                (self.weather_df['taluk'] == taluk) &
-                (self.weather_df['date'] <= ref_dt)
-            ].sort_values('date')
+            rain = self._get_rainfall_data(taluk, ref_dt)['rainfall'].to_numpy(dtype=HISTORY_DTYPE)
+            return rain, _prefix_sums(rain)
+        
+        dates, rain, prefix = self._rain_index.get(taluk, _NO_RAIN)
+        i = np.searchsorted(dates, ref_dt.to_datetime64(), side='left')
+        return rain[:i], prefix[:i + 1]
+    
+    def _latest_weather(self, taluk, ref_dt):
+        """[temp, humidity, wind, pressure] of the last row on or before ref_dt, or None"""
+        if self.use_db:
+            weather_data = self._get_weather_data(taluk, ref_dt)
+            if len(weather_data) == 0:
+                return None
+            return weather_data.iloc[-1][WEATHER_COLUMNS].to_numpy(dtype=HISTORY_DTYPE)
+        
+        dates, values = self._weather_index.get(taluk, _NO_WEATHER)
+        j = np.searchsorted(dates, ref_dt.to_datetime64(), side='right')
+        return values[j - 1] if j > 0 else None
 
     def compute_features(self, taluk, reference_date):
         """
@@ -233,7 +468,7 @@ class FeatureEngineer:
         B5: TEMPORAL VALIDATION - Only uses data BEFORE reference_date
         """
         try:
-            ref_dt = pd.to_datetime(reference_date)
+            ref_dt = _parse_reference_date(reference_date)
         except:
             raise InvalidDateError("Invalid date format. Use YYYY-MM-DD format.")
         
@@ -244,26 +479,18 @@ class FeatureEngineer:
         if ref_dt < today - timedelta(days=3650):
             raise InvalidDateError("Date too far in past (max 10 years back)")
         
-        # B5: Fetch Data (DB or CSV via helper)
-        rain_data = self._get_rainfall_data(taluk, ref_dt)
+        # B5: Fetch Data (DB or in-memory index)
+        rain, prefix = self._rain_before(taluk, ref_dt)
         
-        if len(rain_data) < 30:
+        if len(rain) < 30:
             raise InsufficientDataError(
                 f"Not enough historical data for {taluk}. "
                 "Need at least 30 days of past data."
             )
         
-        # Compute lag features
-        last_30_days = rain_data.tail(30)
-        
-        rain_lag_7 = last_30_days.iloc[-7]['rainfall']
-        rain_lag_30 = last_30_days.iloc[0]['rainfall']
-        rolling_30_rain = last_30_days['rainfall'].sum()
-        
-        # NEW: Drought-specific features
-        rolling_60_rain = rain_data.tail(60)['rainfall'].sum() if len(rain_data) >= 60 else rain_data['rainfall'].sum()
-        rolling_90_rain = rain_data.tail(90)['rainfall'].sum() if len(rain_data) >= 90 else rain_data['rainfall'].sum()
-        dry_days_count = (last_30_days['rainfall'] < 2).sum()  # Days with < 2mm rain
+        # Compute lag + rolling features
+        (rain_lag_7, rain_lag_30, rolling_30_rain,
+         rolling_60_rain, rolling_90_rain, dry_days_count) = _rain_window_features(rain, prefix)
         
         # Calculate deficit vs historical average for this month
         # For historical average, we need aggregation across years
@@ -281,27 +508,25 @@ class FeatureEngineer:
             hist_stats = pd.read_sql(query, self.engine)
             avg_monthly = hist_stats['monthly_rain'].mean() if not hist_stats.empty else 0
         else:
-            hist_same_month = self.rainfall_df[
-                (self.rainfall_df['taluk'] == taluk) &
-                (self.rainfall_df['date'].dt.month == ref_dt.month) &
-                (self.rainfall_df['date'].dt.year < ref_dt.year)
-            ]
-            if len(hist_same_month) > 0:
-                avg_monthly = hist_same_month.groupby(hist_same_month['date'].dt.year)['rainfall'].sum().mean()
-            else:
-                avg_monthly = 0
+            # Mean of this month's totals over earlier years, from the load-time table
+            avg_monthly = 0
+            if taluk in self._monthly_index:
+                years, totals = self._monthly_index[taluk]
+                same_month = totals[years < ref_dt.year, ref_dt.month - 1]
+                same_month = same_month[~np.isnan(same_month)]
+                if len(same_month) > 0:
+                    avg_monthly = float(same_month.mean())
 
         rain_deficit = rolling_30_rain - (avg_monthly if avg_monthly else 0)
         
         # Get weather data
-        weather_data = self._get_weather_data(taluk, ref_dt)
+        latest_weather = self._latest_weather(taluk, ref_dt)
         
-        if len(weather_data) == 0:
+        if latest_weather is None:
             raise InsufficientDataError(
                 f"No weather data available for {taluk}"
             )
-        
-        latest_weather = weather_data.iloc[-1]
+        temp, humidity, wind, pressure = latest_weather
         
         # Build feature dict (12 features total)
         features = {
@@ -312,10 +537,10 @@ class FeatureEngineer:
             'rolling_90_rain': float(rolling_90_rain),
             'dry_days_count': int(dry_days_count),
             'rain_deficit': float(rain_deficit),
-            'temp': float(latest_weather['temp']),
-            'humidity': float(latest_weather['humidity']),
-            'wind': float(latest_weather['wind']),
-            'pressure': float(latest_weather['pressure']),
+            'temp': round(float(temp), 2),
+            'humidity': round(float(humidity), 2),
+            'wind': round(float(wind), 2),
+            'pressure': round(float(pressure), 2),
             'month': int(ref_dt.month)
         }
         
@@ -324,13 +549,17 @@ class FeatureEngineer:
         if set(features.keys()) != set(expected_features):
             raise ValueError(f"Feature computation error")
         
-        # Check for NaN/Inf
-        for key, val in features.items():
-            if pd.isna(val) or np.isinf(val):
-                raise ValueError(f"Invalid data detected in {key}")
+        # Check for NaN/Inf: one C-level pass; name the culprit only on failure
+        if not all(map(math.isfinite, features.values())):
+            key = next(k for k, v in features.items() if not math.isfinite(v))
+            raise ValueError(f"Invalid data detected in {key}")
         
         return features
 
+    def compute_features_array(self, taluk, reference_date):
+        """Same as compute_features, returned as a model-ready (1, 12) row in schema order"""
+        return _feature_matrix([self.compute_features(taluk, reference_date)], self.schema['features'])
+
     def get_recent_rainfall_list(self, taluk, reference_date, days=14):
         """
         Get list of daily rainfall (mm) for the last N days.
@@ -338,21 +567,20 @@ class FeatureEngineer:
         Returns: List of floats [rain_day_1, rain_day_2, ... rain_day_N] (ordered by date)
         """
         try:
-            ref_dt = pd.to_datetime(reference_date)
+            ref_dt = _parse_reference_date(reference_date)
             # We want data strictly BEFORE reference date? 
             # Actually for soil moisture on Day T, we need rain up to Day T-1.
-            # _get_rainfall_data returns data < ref_dt.
-            rain_df = self._get_rainfall_data(taluk, ref_dt)
+            # _rain_before returns data < ref_dt.
+            rain, _ = self._rain_before(taluk, ref_dt)
             
-            if rain_df.empty:
+            if len(rain) == 0:
                 return [0.0] * days
                 
-            last_n = rain_df.tail(days)
             # Ensure we have a list of floats, filling missing days with 0 if needed is tricky 
-            # but for now we take the tailored df.
+            # but for now we take the tailored slice.
             # Better: reindex to ensure all days are present?
             # For MVP, just return the values we have.
-            return last_n['rainfall'].astype(float).tolist()
+            return np.round(rain[-days:].astype(np.float64), 2).tolist()
             
         except Exception as e:
             logger.warning(f"Error fetching recent rainfall: {e}")
@@ -361,15 +589,19 @@ class FeatureEngineer:
 # ==================== B3: ML INFERENCE ====================
 class RainfallPredictor:
     _instance = None
+    _lock = threading.Lock()
     _model = None
+    _classes = None  # model.classes_ as plain labels, in predict_proba column order
     _schema = None
     _quantifier = None
     
     def __new__(cls):
-        """Singleton pattern: only create one instance"""
+        """Singleton pattern: only create one instance (first load is thread-safe)"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._load_model()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._load_model()
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     @classmethod
@@ -380,17 +612,21 @@ class RainfallPredictor:
             
         try:
             logger.info("Loading ML model (first time)...")
-            with open(MODEL_CLASSIFIER, 'rb') as f:
-                cls._model = pickle.load(f)
+            cls._model = _load_model_file(MODEL_CLASSIFIER)
+            cls._classes = cls._model.classes_.tolist()
             
-            with open(FEATURE_SCHEMA, 'r') as f:
-                cls._schema = json.load(f)
+            with open(FEATURE_SCHEMA, 'rb') as f:
+                cls._schema = orjson.loads(f.read())
                 
-            # Initialize UncertaintyQuantifier
+            # Initialize UncertaintyQuantifier (shares the district model loaded above)
             try:
+                try:
+                    taluk_models = _load_model_file(settings.TALUK_MODELS_PATH)
+                except Exception:
+                    taluk_models = None
                 cls._quantifier = UncertaintyQuantifier(
-                    model_path=str(MODEL_CLASSIFIER),
-                    taluk_models_path=str(settings.TALUK_MODELS_PATH)
+                    district_model=cls._model,
+                    taluk_models=taluk_models
                 )
             except Exception as e:
                 logger.warning(f"UncertaintyQuantifier failed to init: {e}")
@@ -420,44 +656,43 @@ class RainfallPredictor:
         Run ML inference with Uncertainty Quantification.
         Returns: (category, confidence_dict, uncertainty_data)
         """
+        return self.predict_batch([features_dict], [taluk])[0]
+    
+    def predict_batch(self, features_list, taluks):
+        """
+        Batch inference: every request goes through each model in one predict_proba call.
+        Returns: list of (category, confidence_dict, uncertainty_data)
+        """
         try:
             # Ensure correct feature order
-            feature_order = self.schema['features']
-            features_list = [features_dict[f] for f in feature_order]
-            
-            raw_conf = {}
-            uncertainty_data = None
+            X = _feature_matrix(features_list, self.schema['features'])
             
             if self.quantifier:
                 # Use UncertaintyQuantifier logic
-                result = self.quantifier.get_prediction_with_uncertainty(features_list, taluk)
+                results = self.quantifier.get_predictions_with_uncertainty(X, taluks)
                 
                 # Convert percentages back to 0-1 probabilities for consistency
-                probs = result['prediction']['probabilities']
-                raw_conf = {
-                    'Deficit': probs['deficit'] / 100.0,
-                    'Normal': probs['normal'] / 100.0,
-                    'Excess': probs['excess'] / 100.0
-                }
-                uncertainty_data = result
+                raw = []
+                for result in results:
+                    probs = result['prediction']['probabilities']
+                    raw.append(({
+                        'Deficit': probs['deficit'] / 100.0,
+                        'Normal': probs['normal'] / 100.0,
+                        'Excess': probs['excess'] / 100.0
+                    }, result))
                 
             else:
-                # Fallback to simple prediction
-                X = np.array([features_list])
-                
-                # Get raw probabilities
-                probabilities = self.model.predict_proba(X)[0]
-                class_names = self.model.classes_
-                
-                raw_conf = {
-                    cls: float(prob) for cls, prob in zip(class_names, probabilities)
-                }
+                # Fallback to simple prediction (one predict_proba pass, no predict)
+                raw = [(dict(zip(self._classes, probabilities.tolist())), None)
+                       for probabilities in self.model.predict_proba(X)]
             
             # Apply Probability Calibration (The "Correction" Layer)
             # This is where we fix the "Normalcy Bias" and "False Alarms"
-            final_cat, final_conf = self.calibrate_prediction(raw_conf, features_dict)
-            
-            return final_cat, final_conf, uncertainty_data
+            predictions = []
+            for (raw_conf, uncertainty_data), features_dict in zip(raw, features_list):
+                final_cat, final_conf = self.calibrate_prediction(raw_conf, features_dict)
+                predictions.append((final_cat, final_conf, uncertainty_data))
+            return predictions
 
         except Exception as e:
             raise RuntimeError(f"ML prediction error: {str(e)}")
@@ -531,47 +766,97 @@ class RainfallPredictor:
                 calibrated[winner], calibrated['Normal'] = calibrated['Normal'], calibrated[winner]
         
         return winner, calibrated
+    
+    def calibrate_prediction_batch(self, raw, months, rolling_rain, classes=None):
+        """
+        Vectorized calibrate_prediction over N rows (same rules, same float ops).
+        raw is an (N, 3) array with columns in `classes` order (model order by default).
+        Returns: (winner labels as an object array, calibrated (N, 3) float array)
+        """
+        classes = list(classes or self._classes)
+        d, n, e = (classes.index(c) for c in ('Deficit', 'Normal', 'Excess'))
+        
+        calibrated = np.array(raw, dtype=np.float64)  # copy
+        months = np.asarray(months)
+        rolling_rain = np.asarray(rolling_rain, dtype=np.float64)
+        deficit, normal, excess = calibrated[:, d], calibrated[:, n], calibrated[:, e]  # column views
+        
+        # RULE 1: Monsoon "Anti-Normal" Bias (June-Aug)
+        monsoon = np.isin(months, (6, 7, 8))
+        normal[monsoon & (normal > 0.4)] *= 0.6
+        excess[monsoon & (excess > 0.05)] *= 2.0
+        
+        # RULE 2: Pre-Monsoon "Anti-Excess" Bias (May)
+        excess[(months == 5) & (excess > 0.5)] *= 0.4
+        
+        # RULE 3: Soil Saturation Limit
+        soaked = rolling_rain > 800.0
+        shift = normal[soaked] * 0.8
+        normal[soaked] -= shift
+        excess[soaked] += shift
+        
+        # RULE 4: Drought Recall (Dry Soil)
+        deficit[(rolling_rain < 50.0) & (deficit > 0.05)] *= 4.0
+        
+        # Base Calibration
+        deficit[deficit > 0.3] *= 1.2
+        excess[excess > 0.3] *= 1.2
+        
+        # Renormalize (summed in column order, as sum() over the dict does)
+        total = calibrated[:, 0] + calibrated[:, 1] + calibrated[:, 2]
+        positive = total > 0
+        calibrated[positive] /= total[positive, None]
+        
+        # Winner and runner-up (argmax keeps the first column on ties, like the stable sort)
+        rows = np.arange(len(calibrated))
+        first = calibrated.argmax(axis=1)
+        score = calibrated[rows, first]
+        masked = calibrated.copy()
+        masked[rows, first] = -np.inf
+        second = masked.argmax(axis=1)
+        
+        # Tie-breaker logic (Risk Averse)
+        swap = (first == n) & (score < 0.7) & (score - calibrated[rows, second] < 0.3)
+        winners = np.asarray(classes, dtype=object)[np.where(swap, second, first)]
+        swap_rows, swap_cols = rows[swap], second[swap]
+        calibrated[swap_rows, n], calibrated[swap_rows, swap_cols] = (
+            calibrated[swap_rows, swap_cols], calibrated[swap_rows, n])
+        
+        return winners, calibrated
 
 # ==================== B6: LIVE WEATHER ====================
 def get_live_forecast_safe(lat, lon):
     """
     Enhanced version with HOURLY precision for Flash Flood Detection.
-    Returns: (rainfall_mm_7d, max_intensity_mm_hr, status, error_message)
+    Successful responses go into the shared forecast cache (within 2 km) for
+    CACHE_TTL_SECONDS; cached values are immutable and handed out as-is.
+    The cached entry also holds the 7-day DayForecast rows, which the advisory
+    layer reads from the cache instead of calling the weather service again
+    (with ENABLE_CACHE off it still makes that second call).
+    Returns: (rainfall_mm_7d, max_intensity_mm_hr, daily_rain, status, error_message)
     """
     import requests
+    from app.core.advisory import FORECAST_PARAMS, forecast_cache, parse_forecast
     
-    url = "https://api.open-meteo.com/v1/forecast"
-    params = {
-        "latitude": lat,
-        "longitude": lon,
-        "daily": "precipitation_sum",
-        "hourly": "precipitation", # NEW: High-res data
-        "timezone": "auto",
-        "forecast_days": 7
-    }
+    if settings.ENABLE_CACHE:
+        cached = forecast_cache.get(lat, lon)
+        if cached is not None:
+            return cached.total_rain_7d, cached.max_intensity, cached.daily_rain, "success", None
+    
+    params = {"latitude": lat, "longitude": lon, **FORECAST_PARAMS}
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(settings.WEATHER_API_URL, params=params,
+                                          timeout=settings.WEATHER_API_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-        
-        # 1. Daily Totals (Volume)
-        daily_rain = data.get("daily", {}).get("precipitation_sum", [])
-        if not daily_rain:
-            return None, None, "error", "Weather service returned no data"
+        forecast = parse_forecast(response.json())
+        if forecast is None:
+            return None, None, [], "error", "Weather service returned no data"
         
-        total_rain_7d = sum([x for x in daily_rain if x is not None])
+        if settings.ENABLE_CACHE:
+            forecast_cache.put(lat, lon, forecast)
         
-        # 2. Hourly Intensity (Flash Flood Risk)
-        hourly_rain = data.get("hourly", {}).get("precipitation", [])
-        max_intensity = 0.0
-        if hourly_rain:
-            # Filter None values and find max
-            valid_hourly = [x for x in hourly_rain if x is not None]
-            if valid_hourly:
-                max_intensity = max(valid_hourly)
-        
-        return total_rain_7d, max_intensity, daily_rain, "success", None
+        return forecast.total_rain_7d, forecast.max_intensity, forecast.daily_rain, "success", None
         
     except requests.Timeout:
         return None, None, [], "error", "Weather service timeout"
@@ -879,83 +1164,132 @@ def localize_payload(payload, lang='en'):
     return payload
 
 # ==================== B4: MAIN API LOGIC ====================
+# Weather fetches run here so the network wait overlaps feature engineering + inference
+_weather_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="weather")
+
 def process_advisory_request(user_id, gps_lat, gps_long, date_str, mapper=None, engineer=None, predictor=None, language='en'):
     """
     Main backend pipeline: GPS → Features → ML → Farmer-Friendly Output
     With comprehensive error handling and Dependency Injection for performance
+    (a one-request batch; see process_advisory_batch)
     """
+    return process_advisory_batch(
+        [(user_id, gps_lat, gps_long, date_str)],
+        mapper=mapper, engineer=engineer, predictor=predictor, language=language
+    )[0]
+
+def process_advisory_batch(advisory_requests, mapper=None, engineer=None, predictor=None, language='en'):
+    """
+    Batch pipeline for (user_id, gps_lat, gps_long, date_str) tuples.
+    Features are computed per request, then all valid rows share one
+    predict_proba call per model. Returns one response per request, in order;
+    a failing request gets its own error response without affecting the rest.
+    """
+    responses = [None] * len(advisory_requests)
+    pending = []  # (index, taluk, geo_confidence, features, rainfall_history)
+    weather = {}  # index -> Future of get_live_forecast_safe
+    
+    # Step 1: GPS → Taluk (B1), mapped for the whole batch at once
     try:
-        # Step 1: GPS → Taluk (B1)
-        try:
-            if mapper is None:
-                mapper = TalukMapper()
-            taluk, geo_confidence = mapper.get_taluk(gps_lat, gps_long)
-        except GPSOutOfBoundsError as e:
-            return build_error_response("gps_error", str(e))
-        
-        # Step 2: Compute Features (B2 + B5)
+        if mapper is None:
+            mapper = TalukMapper()
+        locations = mapper.get_taluks_batch([r[1] for r in advisory_requests],
+                                            [r[2] for r in advisory_requests])
+    except Exception as e:
+        logger.error(f"Unexpected error in advisory request: {e}", exc_info=True)
+        return [build_error_response("system_error", str(e), user_friendly=True)
+                for _ in advisory_requests]
+    
+    for i, (user_id, gps_lat, gps_long, date_str) in enumerate(advisory_requests):
         try:
-            if engineer is None:
-                engineer = FeatureEngineer()
-            features = engineer.compute_features(taluk, date_str)
-            # NEW: Get raw history for Soil Moisture
-            rainfall_history = engineer.get_recent_rainfall_list(taluk, date_str, days=14)
+            if isinstance(locations[i], GPSOutOfBoundsError):
+                responses[i] = build_error_response("gps_error", str(locations[i]))
+                continue
+            taluk, geo_confidence = locations[i]
+            
+            # Step 2: Compute Features (B2 + B5)
+            try:
+                if engineer is None:
+                    engineer = FeatureEngineer()
+                features = engineer.compute_features(taluk, date_str)
+                # NEW: Get raw history for Soil Moisture
+                rainfall_history = engineer.get_recent_rainfall_list(taluk, date_str, days=14)
+                
+            except InvalidDateError as e:
+                responses[i] = build_error_response("date_error", str(e))
+                continue
+            except InsufficientDataError as e:
+                responses[i] = build_error_response("data_error", str(e))
+                continue
+            
+            # Step 4 starts early for valid requests: the Open-Meteo round-trip
+            # overlaps the remaining feature work and the ML pass
+            weather[i] = _weather_pool.submit(get_live_forecast_safe, gps_lat, gps_long)
+            pending.append((i, taluk, geo_confidence, features, rainfall_history))
             
-        except InvalidDateError as e:
-            return build_error_response("date_error", str(e))
-        except InsufficientDataError as e:
-            return build_error_response("data_error", str(e))
-        
-        # Step 3: ML Prediction (B3)
-        try:
-            if predictor is None:
-                predictor = RainfallPredictor()
-            ml_category, confidences, uncertainty_data = predictor.predict(features, taluk)
         except Exception as e:
-            logger.error(f"ML prediction failed: {e}")
-            return build_error_response("system_error", "Prediction system error")
-        
-        # Step 4: Live Weather (B6)
-        live_rain, max_intensity, daily_forecast, weather_status, weather_error = get_live_forecast_safe(gps_lat, gps_long)
-        
-        # If weather API fails, use conservative fallback
-        if weather_status == "error":
-            logger.warning(f"Weather API failed: {weather_error}. Using climatological mean.")
-            # Use historical average for that month (rough estimate)
-            # Better safe than sorry: Assume "Normal" rainfall (~5-10mm/day in monsoon)
-            live_rain = 50.0 # Conservative estimate (moderate rain) to avoid missing potential wetness
-            max_intensity = 0.0 # Cannot guess intensity without data
-            daily_forecast = []
-            weather_status = "estimated"
-        
-        # Step 5: Build Farmer-Friendly Response
-        response = build_farmer_response(
-            ml_category=ml_category,
-            forecast_7day_mm=live_rain,
-            taluk=taluk,
-            geo_confidence=geo_confidence,
-            confidences=confidences,
-            uncertainty_data=uncertainty_data,
-            max_intensity_mm_per_hr=max_intensity, # Added max_intensity
-            rainfall_history=rainfall_history, # NEW
-            daily_forecast=daily_forecast # NEW
-        )
-        
-        # Add weather data source info
-        response['data_sources'] = {
-            "weather_forecast": "live" if weather_status == "success" else "historical_estimate",
-            "location_accuracy": geo_confidence,
-            "last_updated": datetime.now().isoformat()
-        }
-        
-        
-        
-        return response
-        
+            # Catch-all for unexpected errors
+            logger.error(f"Unexpected error in advisory request: {e}", exc_info=True)
+            responses[i] = build_error_response("system_error", str(e), user_friendly=True)
+    
+    if not pending:
+        return responses
+    
+    # Step 3: ML Prediction (B3), one model pass for the whole batch
+    try:
+        if predictor is None:
+            predictor = RainfallPredictor()
+        predictions = predictor.predict_batch([p[3] for p in pending], [p[1] for p in pending])
     except Exception as e:
-        # Catch-all for unexpected errors
-        logger.error(f"Unexpected error in advisory request: {e}", exc_info=True)
-        return build_error_response("system_error", str(e), user_friendly=True)
+        logger.error(f"ML prediction failed: {e}")
+        for p in pending:
+            responses[p[0]] = build_error_response("system_error", "Prediction system error")
+        return responses
+    
+    for (i, taluk, geo_confidence, features, rainfall_history), \
+            (ml_category, confidences, uncertainty_data) in zip(pending, predictions):
+        try:
+            # Step 4: Live Weather (B6), fetched in the background since Step 2
+            live_rain, max_intensity, daily_forecast, weather_status, weather_error = weather[i].result()
+            
+            # If weather API fails, use conservative fallback
+            if weather_status == "error":
+                logger.warning(f"Weather API failed: {weather_error}. Using climatological mean.")
+                # Use historical average for that month (rough estimate)
+                # Better safe than sorry: Assume "Normal" rainfall (~5-10mm/day in monsoon)
+                live_rain = 50.0 # Conservative estimate (moderate rain) to avoid missing potential wetness
+                max_intensity = 0.0 # Cannot guess intensity without data
+                daily_forecast = []
+                weather_status = "estimated"
+            
+            # Step 5: Build Farmer-Friendly Response
+            response = build_farmer_response(
+                ml_category=ml_category,
+                forecast_7day_mm=live_rain,
+                taluk=taluk,
+                geo_confidence=geo_confidence,
+                confidences=confidences,
+                uncertainty_data=uncertainty_data,
+                max_intensity_mm_per_hr=max_intensity, # Added max_intensity
+                rainfall_history=rainfall_history, # NEW
+                daily_forecast=daily_forecast # NEW
+            )
+            
+            # Add weather data source info
+            response['data_sources'] = {
+                "weather_forecast": "live" if weather_status == "success" else "historical_estimate",
+                "location_accuracy": geo_confidence,
+                "last_updated": datetime.now().isoformat()
+            }
+            
+            responses[i] = response
+            
+        except Exception as e:
+            # Catch-all for unexpected errors
+            logger.error(f"Unexpected error in advisory request: {e}", exc_info=True)
+            responses[i] = build_error_response("system_error", str(e), user_friendly=True)
+    
+    return responses
 
 # ==================== TESTING ====================
 if __name__ == "__main__":
@@ -982,4 +1316,4 @@ if __name__ == "__main__":
     )
     
     print(f"\n📤 FARMER-FRIENDLY RESPONSE:")
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode())
@@ -56,6 +56,7 @@ class Settings(BaseSettings):
     # Cache
     ENABLE_CACHE: bool = True
     CACHE_TTL_SECONDS: int = 3600  # 1 hour
+    FORECAST_PRIME_INTERVAL_SECONDS: int = 1500  # 25 min (below the TTL); 0 disables
     
     class Config:
         env_file = ".env"
@@ -4,12 +4,97 @@ Enhanced Farmer Advisory System
 Provides actionable recommendations, not just predictions
 """
 
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-import requests
 from pathlib import Path
 from app.config import settings
+from app.core.forecast_cache import SpatialForecastCache
+from app.core.http_client import get_http_session
 BASE_DIR = Path(settings.BASE_DIR)
 
+
+@dataclass(slots=True, frozen=True)
+class DayForecast:
+    """One day of the 7-day forecast (immutable, so cached forecasts can be shared)"""
+    date: str
+    day_name: str
+    weekday: str
+    dm: str
+    rain_mm: float
+    temp_max: float
+    temp_min: float
+
+
+def build_daily_forecast(daily):
+    """
+    Convert an Open-Meteo daily block into the 7-day list used by the advisory.
+    Dates are parsed once here; formatters use the precomputed labels.
+    """
+    forecast = []
+    for date, rain, temp_max, temp_min in zip(daily['time'][:7],
+                                              daily['precipitation_sum'],
+                                              daily['temperature_2m_max'],
+                                              daily['temperature_2m_min']):
+        date_obj = datetime.fromisoformat(date)
+        forecast.append(DayForecast(
+            date=date,
+            day_name=date_obj.strftime('%a'),
+            weekday=date_obj.strftime('%A'),
+            dm=date_obj.strftime('%d/%m'),
+            rain_mm=rain,
+            temp_max=temp_max,
+            temp_min=temp_min
+        ))
+    return forecast
+
+
+@dataclass(slots=True, frozen=True)
+class LiveForecast:
+    """One location's forecast as cached and shared by every weather consumer"""
+    total_rain_7d: float
+    max_intensity: float
+    daily_rain: tuple
+    days: tuple  # DayForecast rows
+
+
+# Open-Meteo query shared by the single-point and batched fetches
+FORECAST_PARAMS = {
+    'daily': 'precipitation_sum,temperature_2m_max,temperature_2m_min',
+    'hourly': 'precipitation',
+    'timezone': 'Asia/Kolkata',
+    'forecast_days': 7
+}
+
+# The only forecast cache: the live weather overlay, the advisory layer and
+# the background primer all read and write it
+forecast_cache = SpatialForecastCache(ttl_seconds=settings.CACHE_TTL_SECONDS)
+
+
+def parse_forecast(data):
+    """
+    Reduce one location's Open-Meteo payload to a LiveForecast.
+    Returns None when the payload has no daily rainfall.
+    """
+    daily = data.get('daily', {})
+    daily_rain = daily.get('precipitation_sum', [])
+    if not daily_rain:
+        return None
+    
+    # Daily totals (volume) and hourly peak (flash flood risk)
+    total_rain_7d = sum(x for x in daily_rain if x is not None)
+    valid_hourly = [x for x in data.get('hourly', {}).get('precipitation', []) if x is not None]
+    max_intensity = max(valid_hourly) if valid_hourly else 0.0
+    
+    # Day rows need dates and temperatures too; without them keep the rain figures
+    try:
+        days = tuple(build_daily_forecast(daily))
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Forecast day rows unavailable: {e}")
+        days = ()
+    
+    return LiveForecast(total_rain_7d, max_intensity, tuple(daily_rain), days)
+
+
 class AdvisoryService:
     """Generate farmer-friendly actionable advice"""
     
@@ -81,45 +166,106 @@ class AdvisoryService:
             
         return alerts
 
+    # Shared by every AdvisoryService instance (one is created per request)
+    _forecast_cache = forecast_cache
+    
     def get_7day_forecast(self, lat, lon):
-        """Get 7-day weather forecast from Open-Meteo"""
+        """Get 7-day weather forecast from Open-Meteo (cached for nearby points)"""
+        if settings.ENABLE_CACHE:
+            cached = self._forecast_cache.get(lat, lon)
+            if cached is not None:
+                return list(cached.days)
+        
         try:
-            url = f"https://api.open-meteo.com/v1/forecast"
-            params = {
-                'latitude': lat,
-                'longitude': lon,
-                'daily': 'precipitation_sum,temperature_2m_max,temperature_2m_min',
-                'timezone': 'Asia/Kolkata',
-                'forecast_days': 7
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            params = {'latitude': lat, 'longitude': lon, **FORECAST_PARAMS}
             
-            forecast = []
-            for i in range(7):
-                forecast.append({
-                    'date': data['daily']['time'][i],
-                    'rain_mm': data['daily']['precipitation_sum'][i],
-                    'temp_max': data['daily']['temperature_2m_max'][i],
-                    'temp_min': data['daily']['temperature_2m_min'][i]
-                })
+            response = get_http_session().get(settings.WEATHER_API_URL, params=params,
+                                              timeout=settings.WEATHER_API_TIMEOUT)
+            forecast = parse_forecast(response.json())
+            if forecast is None:
+                return []
+            if settings.ENABLE_CACHE:
+                self._forecast_cache.put(lat, lon, forecast)
             
-            return forecast
+            return list(forecast.days)
 
         except Exception as e:
             print(f"Forecast error: {e}")
             return []
     
+    def get_7day_forecasts(self, coordinates, batch_size=64, refresh=False):
+        """
+        Get 7-day forecasts for many (lat, lon) points, e.g. for bulk SMS runs.
+        Open-Meteo accepts comma-separated coordinate lists, so every chunk of
+        up to batch_size points costs a single HTTP round-trip.
+        Points already in the forecast cache are not fetched again unless refresh=True.
+        Returns forecasts in input order ([] for points whose chunk failed).
+        """
+        coordinates = list(coordinates)
+        forecasts = [[] for _ in coordinates]
+        
+        # Only fetch the points the cache cannot answer
+        pending = []
+        for i, (lat, lon) in enumerate(coordinates):
+            use_cache = settings.ENABLE_CACHE and not refresh
+            cached = self._forecast_cache.get(lat, lon) if use_cache else None
+            if cached is not None:
+                forecasts[i] = list(cached.days)
+            else:
+                pending.append(i)
+        
+        for start in range(0, len(pending), batch_size):
+            indices = pending[start:start + batch_size]
+            chunk = [coordinates[i] for i in indices]
+            try:
+                params = {
+                    'latitude': ','.join(str(lat) for lat, _ in chunk),
+                    'longitude': ','.join(str(lon) for _, lon in chunk),
+                    **FORECAST_PARAMS
+                }
+                
+                response = get_http_session().get(settings.WEATHER_API_URL, params=params,
+                                                  timeout=settings.WEATHER_API_TIMEOUT)
+                response.raise_for_status()
+                data = response.json()
+                
+                # One location comes back as an object, several as a list
+                if isinstance(data, dict):
+                    data = [data]
+                if len(data) != len(chunk):
+                    raise ValueError(f"expected {len(chunk)} locations, got {len(data)}")
+                
+                for i, (lat, lon), item in zip(indices, chunk, data):
+                    forecast = parse_forecast(item)
+                    if forecast is None:
+                        continue
+                    forecasts[i] = list(forecast.days)
+                    if settings.ENABLE_CACHE:
+                        self._forecast_cache.put(lat, lon, forecast)
+                
+            except Exception as e:
+                print(f"Forecast batch error: {e}")
+        
+        return forecasts
+    
+    def prime_cache(self, coordinates):
+        """
+        Re-fetch forecasts for the given (lat, lon) points so farmer requests
+        find a warm cache. Run periodically, more often than the cache TTL.
+        Returns the number of points refreshed.
+        """
+        forecasts = self.get_7day_forecasts(coordinates, refresh=True)
+        return sum(1 for forecast in forecasts if forecast)
+    
     def get_weather_extremes(self, forecast_7day):
         """Detect weather extremes that can damage crops"""
         alerts = []
         
         for i, day in enumerate(forecast_7day[:7]):
-            day_name = day['date']
-            rain = day['rain_mm']
-            temp_max = day['temp_max']
-            temp_min = day['temp_min']
+            day_name = day.date
+            rain = day.rain_mm
+            temp_max = day.temp_max
+            temp_min = day.temp_min
             
             # High wind alert (if available in forecast)
             # Note: Open-Meteo provides wind speed
@@ -236,9 +382,10 @@ class AdvisoryService:
         else:
             return 'extremely_dry', api
 
-    def get_water_source_advice(self):
-        """Seasonal water source recommendations"""
-        month = datetime.now().month
+    def get_water_source_advice(self, month=None):
+        """Seasonal water source recommendations (for the current month by default)"""
+        if month is None:
+            month = datetime.now().month
         
         # Summer (Feb-May)
         if 2 <= month <= 5:
@@ -358,11 +505,11 @@ class AdvisoryService:
         for i, day in enumerate(forecast_7day[:7]):
             day_date = today + timedelta(days=i)
             day_name = day_date.strftime('%A')
-            rain_mm = day['rain_mm']
-            temp_max = day['temp_max']
+            rain_mm = day.rain_mm
+            temp_max = day.temp_max
             
             day_actions = {
-                'date': day['date'],
+                'date': day.date,
                 'day': day_name,
                 'actions': []
             }
@@ -509,6 +656,22 @@ class AdvisoryService:
         
         return advice
     
+    # District rainfall history (dates, mm) sorted by date, read once per process
+    _rain_history = None
+    
+    @classmethod
+    def _load_rain_history(cls):
+        if cls._rain_history is None:
+            import numpy as np
+            import pandas as pd
+            
+            df = pd.read_csv(settings.RAINFALL_DATA_PATH, usecols=['date', 'rainfall'],
+                             parse_dates=['date'], date_format='ISO8601')
+            df = df.sort_values('date', kind='stable')
+            cls._rain_history = (df['date'].to_numpy(dtype='datetime64[ns]'),
+                                 df['rainfall'].to_numpy(dtype=np.float64))
+        return cls._rain_history
+    
     def get_prediction_confidence_stats(self, category, confidence):
         """Generate trust indicators showing model accuracy"""
         import pandas as pd
@@ -552,14 +715,12 @@ class AdvisoryService:
         
         # Last prediction (if available)
         try:
-            rainfall_path = BASE_DIR / settings.RAINFALL_DATA_PATH
-            rain_df = pd.read_csv(rainfall_path)
-            rain_df['date'] = pd.to_datetime(rain_df['date'], format='mixed')
+            dates, rain = self._load_rain_history()
             last_month = datetime.now() - timedelta(days=30)
-            recent_data = rain_df[rain_df['date'] >= last_month]
+            recent_data = rain[dates.searchsorted(pd.Timestamp(last_month).to_datetime64(), side='left'):]
             
             if len(recent_data) > 0:
-                total_rain = recent_data['rainfall'].sum()
+                total_rain = recent_data.sum()
                 actual_category = 'Excess' if total_rain > 100 else 'Deficit' if total_rain < 50 else 'Normal'
                 stats['last_month_actual'] = f'{actual_category} ({total_rain:.0f}mm)'
         except:
@@ -641,13 +802,12 @@ class AdvisoryService:
         breakdown = []
         
         for day in forecast_7day[:3]:  # Next 3 days only
-            date_obj = datetime.fromisoformat(day['date'])
-            day_name = date_obj.strftime('%A')
+            day_name = day.weekday
             
             # Simple heuristic: split daily rain into morning/evening
-            daily_rain = day['rain_mm']
-            temp_max = day['temp_max']
-            temp_min = day['temp_min']
+            daily_rain = day.rain_mm
+            temp_max = day.temp_max
+            temp_min = day.temp_min
             
             # Morning typically cooler
             morning_temp = temp_min + 2
@@ -673,7 +833,7 @@ class AdvisoryService:
             
             breakdown.append({
                 'day': day_name,
-                'date': day['date'],
+                'date': day.date,
                 'morning': {
                     'time': {'en': '6am-12pm', 'kn': 'ಬೆಳಿಗ್ಗೆ 6-12'},
                     'rain': f'{morning_rain:.1f}mm',
@@ -706,11 +866,11 @@ class AdvisoryService:
             return {}
         
         today = forecast_7day[0]
-        rain_today = today['rain_mm']
-        temp_today = today['temp_max']
+        rain_today = today.rain_mm
+        temp_today = today.temp_max
         
         # Also check tomorrow for planning
-        rain_tomorrow = forecast_7day[1]['rain_mm'] if len(forecast_7day) > 1 else 0
+        rain_tomorrow = forecast_7day[1].rain_mm if len(forecast_7day) > 1 else 0
         
         decisions = {}
         
@@ -833,7 +993,8 @@ class AdvisoryService:
         category = pred['category']
         confidence = pred['confidence_percent']
         
-        # Get 7-day forecast
+        # Get 7-day forecast (a cache hit: the prediction just fetched it;
+        # with ENABLE_CACHE off this is a second Open-Meteo call)
         forecast_7day = self.get_7day_forecast(lat, lon)
         
         # Get risk level
@@ -891,7 +1052,7 @@ class AdvisoryService:
                 'risk_icon': risk_icon,
                 'risk_description': risk_desc
             },
-            'forecast_7day': forecast_7day,
+            'forecast_7day': [asdict(day) for day in forecast_7day],
             'daily_schedule': daily_schedule,
             'hourly_breakdown': hourly_breakdown,
             'weather_alerts': weather_alerts,
@@ -913,90 +1074,84 @@ class AdvisoryService:
     def format_for_farmer(self, advisory, farmer_name='Farmer', language='en'):
         """Format advisory in farmer-friendly way"""
         
-        pred = advisory['prediction']
+        def tr(value):
+            # Bilingual fields are {'en': ..., 'kn': ...}; pick the requested language
+            if isinstance(value, dict) and 'en' in value:
+                return value.get(language, value['en'])
+            return value
         
-        output = f"""
-{'='*70}
-🌾 FARMING ADVISORY - {datetime.now().strftime('%d %B %Y')}
-{'='*70}
-
-Namaste {farmer_name}!
-
-📊 THIS MONTH'S FORECAST:
-   {pred['risk_icon']} {pred['category'].upper()} rainfall predicted
-   Confidence: {pred['confidence']}%
-   Risk Level: {pred['risk_level']} - {pred['risk_description']}
-
-"""
+        pred = advisory['prediction']
+        sep = '=' * 70
+        
+        # Collect fragments and join once instead of repeated string concatenation
+        out = [
+            f"\n{sep}\n"
+            f"🌾 FARMING ADVISORY - {datetime.now().strftime('%d %B %Y')}\n"
+            f"{sep}\n\n"
+            f"Namaste {farmer_name}!\n\n"
+            f"📊 THIS MONTH'S FORECAST:\n"
+            f"   {pred['risk_icon']} {pred['category'].upper()} rainfall predicted\n"
+            f"   Confidence: {pred['confidence']}%\n"
+            f"   Risk Level: {pred['risk_level']} - {tr(pred['risk_description'])}\n\n"
+        ]
+        append = out.append
         
         # 7-day forecast
         if advisory.get('forecast_7day'):
-            output += "📅 7-DAY WEATHER FORECAST:\n"
+            append("📅 7-DAY WEATHER FORECAST:\n")
             for day in advisory['forecast_7day'][:7]:
-                date_obj = datetime.fromisoformat(day['date'])
-                day_name = date_obj.strftime('%a')
                 rain_icon = '🌧️' if day['rain_mm'] > 10 else '🌦️' if day['rain_mm'] > 2 else '☀️'
-                output += f"   {day_name} {date_obj.strftime('%d/%m')}: {rain_icon} {day['rain_mm']:.0f}mm, {day['temp_min']:.0f}-{day['temp_max']:.0f}°C\n"
-            output += "\n"
+                append(f"   {day['day_name']} {day['dm']}: {rain_icon} {day['rain_mm']:.0f}mm, {day['temp_min']:.0f}-{day['temp_max']:.0f}°C\n")
+            append("\n")
         
         # Daily schedule
         if advisory.get('daily_schedule'):
-            output += "📋 DAY-BY-DAY ACTION PLAN:\n\n"
+            append("📋 DAY-BY-DAY ACTION PLAN:\n\n")
             for day in advisory['daily_schedule']:
-                output += f"   {day['day'].upper()}:\n"
+                append(f"   {day['day'].upper()}:\n")
                 for action in day['actions']:
                     priority_icon = '🚨' if action['priority'] == 'URGENT' else '⚠️' if action['priority'] == 'HIGH' else '📌'
-                    output += f"   {priority_icon} {action['time']}: {action['action']}\n"
-                    output += f"      Why: {action['why']}\n"
-                output += "\n"
+                    append(f"   {priority_icon} {tr(action['time'])}: {tr(action['action'])}\n")
+                    append(f"      Why: {tr(action['why'])}\n")
+                append("\n")
         
         # Actions
-        if 'immediate' in advisory['actions'] and advisory['actions']['immediate']:
-            output += "🚨 IMMEDIATE ACTIONS:\n"
-            for action in advisory['actions']['immediate']:
-                output += f"   {action}\n"
-            output += "\n"
-        
-        if 'this_week' in advisory['actions'] and advisory['actions']['this_week']:
-            output += "📋 THIS WEEK:\n"
-            for action in advisory['actions']['this_week']:
-                output += f"   • {action}\n"
-            output += "\n"
-        
-        if 'prepare' in advisory['actions'] and advisory['actions']['prepare']:
-            output += "⚙️ PREPARE:\n"
-            for action in advisory['actions']['prepare']:
-                output += f"   • {action}\n"
-            output += "\n"
+        for key, heading, bullet in (('immediate', "🚨 IMMEDIATE ACTIONS:\n", ''),
+                                     ('this_week', "📋 THIS WEEK:\n", '• '),
+                                     ('prepare', "⚙️ PREPARE:\n", '• ')):
+            if advisory['actions'].get(key):
+                append(heading)
+                for action in advisory['actions'][key]:
+                    append(f"   {bullet}{tr(action)}\n")
+                append("\n")
         
         # Crop-specific
         if advisory.get('crop_advice'):
-            output += "🌱 CROP-SPECIFIC ADVICE:\n\n"
+            append("🌱 CROP-SPECIFIC ADVICE:\n\n")
             for crop, advice in advisory['crop_advice'].items():
-                output += f"   {advice['name'].upper()}:\n"
-                output += f"   Water need: {advice['water_need']}\n"
+                append(f"   {tr(advice['name']).upper()}:\n")
+                append(f"   Water need: {advice['water_need']}\n")
                 for action in advice['actions']:
-                    output += f"   • {action}\n"
-                output += "\n"
+                    append(f"   • {tr(action)}\n")
+                append("\n")
         
         # Prediction confidence
         if advisory.get('prediction_confidence'):
             conf = advisory['prediction_confidence']
-            output += "🎯 PREDICTION CONFIDENCE:\n"
-            output += f"   Model Track Record: {conf['model_accuracy']}\n"
-            output += f"   Reliability: {conf['reliability']}\n"
-            output += f"   {conf['category_performance']}\n"
+            append("🎯 PREDICTION CONFIDENCE:\n")
+            append(f"   Model Track Record: {conf['model_accuracy']}\n")
+            append(f"   Reliability: {tr(conf['reliability'])}\n")
+            append(f"   {conf['category_performance']}\n")
             if 'recent_accuracy' in conf:
-                output += f"   Recent: {conf['recent_accuracy']}\n"
-            output += "\n"
+                append(f"   Recent: {conf['recent_accuracy']}\n")
+            append("\n")
         
-        output += "="*70 + "\n"
-        output += "💡 TIP: Check forecast again in 3-4 days\n"
-        output += "📱 Questions? Contact agricultural officer\n"
-        output += "="*70
+        append(f"{sep}\n")
+        append("💡 TIP: Check forecast again in 3-4 days\n")
+        append("📱 Questions? Contact agricultural officer\n")
+        append(sep)
         
-        return output
-
+        return ''.join(out)
 
 if __name__ == '__main__':
     # Demo
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Spatially tolerant forecast cache
+Farmers in the same village share one forecast instead of each paying
+for an Open-Meteo round-trip
+"""
+
+import math
+import threading
+import time
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km between two GPS points"""
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = (math.sin(dlat / 2) ** 2 +
+         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
+         math.sin(dlon / 2) ** 2)
+    return 6371 * 2 * math.asin(math.sqrt(a))
+
+
+class SpatialForecastCache:
+    """
+    TTL cache keyed by location with a distance tolerance.
+
+    Entries are bucketed into grid cells but keep their real coordinates.
+    A lookup scans the 3x3 block of cells around the point and returns the
+    closest fresh entry within tolerance_km. The cell size must be at least
+    the tolerance so that block covers every candidate (0.02° is ~2.2 km of
+    latitude, and ~2.15 km of longitude at Udupi's latitude).
+
+    Each entry also remembers when a lookup last returned it, so a primer
+    can refresh only the locations farmers are still asking about.
+    """
+
+    def __init__(self, ttl_seconds, tolerance_km=2.0, cell_deg=0.02, max_entries=4096):
+        self.ttl_seconds = ttl_seconds
+        self.tolerance_km = tolerance_km
+        self.cell_deg = cell_deg
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cells = {}  # (cell_lat, cell_lon) -> [[lat, lon, stored_at, value, last_read], ...]
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def get(self, lat, lon):
+        """Return a cached value near (lat, lon), or None on a miss"""
+        now = time.monotonic()
+        cell_lat, cell_lon = self._cell(lat, lon)
+        best, best_dist = None, self.tolerance_km
+
+        with self._lock:
+            for dlat in (-1, 0, 1):
+                for dlon in (-1, 0, 1):
+                    for entry in self._cells.get((cell_lat + dlat, cell_lon + dlon), ()):
+                        if now - entry[2] > self.ttl_seconds:
+                            continue
+                        dist = haversine_km(lat, lon, entry[0], entry[1])
+                        if dist <= best_dist:
+                            best, best_dist = entry, dist
+
+            if best is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            best[4] = now
+            return best[3]
+
+    def put(self, lat, lon, value):
+        """
+        Store value at its real coordinates.
+        Replacing a point keeps its last read time, so re-priming an entry
+        does not count as a farmer asking for it.
+        """
+        now = time.monotonic()
+        key = self._cell(lat, lon)
+
+        with self._lock:
+            if self._size >= self.max_entries:
+                self._evict_expired(now)
+
+            # Drop stale entries (and any older copy of this point) while we are here
+            last_read = now
+            fresh = []
+            for e in self._cells.get(key, ()):
+                if (e[0], e[1]) == (lat, lon):
+                    last_read = e[4]
+                elif now - e[2] <= self.ttl_seconds:
+                    fresh.append(e)
+            fresh.append([lat, lon, now, value, last_read])
+            self._size += len(fresh) - len(self._cells.get(key, ()))
+            self._cells[key] = fresh
+
+    def _evict_expired(self, now):
+        """Sweep every cell; called with the lock held"""
+        for key in list(self._cells):
+            fresh = [e for e in self._cells[key] if now - e[2] <= self.ttl_seconds]
+            if fresh:
+                self._cells[key] = fresh
+            else:
+                del self._cells[key]
+        self._size = sum(len(entries) for entries in self._cells.values())
+
+        # Still full of fresh entries: start over rather than grow without bound
+        if self._size >= self.max_entries:
+            self._cells.clear()
+            self._size = 0
+
+    def locations(self, active_seconds=None):
+        """
+        Coordinates of fresh entries read within active_seconds (default: the TTL).
+        Used to re-prime the cache; points nobody asks for drop out of the list.
+        """
+        now = time.monotonic()
+        window = self.ttl_seconds if active_seconds is None else active_seconds
+        with self._lock:
+            return [(e[0], e[1]) for entries in self._cells.values() for e in entries
+                    if now - e[2] <= self.ttl_seconds and now - e[4] <= window]
+
+    def stats(self):
+        """Hit/miss counters for monitoring"""
+        total = self.hits + self.misses
+        return {
+            'entries': self._size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
+
+    def clear(self):
+        with self._lock:
+            self._cells.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for Open-Meteo calls
+One keep-alive connection pool per process instead of a new TCP + TLS
+handshake for every forecast request
+"""
+
+import threading
+
+# Forecast fetches run on the 8-thread weather pool plus the API's request
+# threads; keep enough idle connections per host that they are reused
+POOL_CONNECTIONS = 4   # distinct hosts kept
+POOL_MAXSIZE = 16      # idle connections kept per host
+
+# Transient upstream 5xx responses are retried a couple of times with a short
+# backoff instead of failing the advisory outright. Connection errors and read
+# timeouts are not retried: an unreachable service should fall back to
+# climatology at once, and the request's own timeout already bounds latency.
+RETRY_TOTAL = 2
+RETRY_BACKOFF_SECONDS = 0.3
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_http_session():
+    """Process-wide requests.Session with a pooled, retrying HTTPAdapter (created on first use)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=RETRY_TOTAL,
+                    connect=0,
+                    read=0,
+                    backoff_factor=RETRY_BACKOFF_SECONDS,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=frozenset({'GET'}),
+                    respect_retry_after_header=False,  # keep the backoff bounded
+                    raise_on_status=False  # hand the last response back; callers check the status
+                )
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                                      max_retries=retry)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
@@ -10,6 +10,8 @@
 #   "color": "#FF0000"
 # }
 
+from bisect import bisect_left, bisect_right
+
 FARMER_MESSAGES = {
     # === RAINFALL STATUS ===
     "deficit": {
@@ -288,33 +290,21 @@ FARMER_MESSAGES = {
     }
 }
 
+# Category -> (bisect function, 7-day thresholds, scenario per bucket)
+# Deficit buckets: <5 critical, 5-15 moderate, >=15 relief rain
+# Normal/Excess buckets: <=60 normal, 60-100 heavy rain warning, >100 critical flood
+_CAT = {"Deficit": 0, "Normal": 1, "Excess": 2}
+_DEFICIT_RULE = (bisect_right, (5, 15), ("drought_critical", "drought_moderate", "relief_rain"))
+_WET_RULE = (bisect_left, (60, 100), ("normal", "flood_warning", "flood_critical"))
+_RULES = (_DEFICIT_RULE, _WET_RULE, _WET_RULE)
+
 def get_farmer_friendly_scenario(ml_category, forecast_7day_mm):
     """
     Convert technical data into farmer-friendly scenario
     Returns scenario key for translation
     """
-    # Critical drought
-    if ml_category == "Deficit" and forecast_7day_mm < 5:
-        return "drought_critical"
-    
-    # Moderate drought    
-    if ml_category == "Deficit" and forecast_7day_mm < 15:
-        return "drought_moderate"
-    
-    # Relief rain
-    if ml_category == "Deficit" and forecast_7day_mm >= 15:
-        return "relief_rain"
-    
-    # Critical flood
-    if forecast_7day_mm > 100:
-        return "flood_critical"
-    
-    # Heavy rain warning
-    if forecast_7day_mm > 60:
-        return "flood_warning"
-    
-    # Normal
-    return "normal"
+    find_bucket, thresholds, scenarios = _RULES[_CAT.get(ml_category, 1)]
+    return scenarios[find_bucket(thresholds, forecast_7day_mm)]
 
 def get_rainfall_category_simple(forecast_mm):
     """Convert mm to simple farmer-friendly category"""
@@ -6,18 +6,30 @@ Provides prediction intervals and confidence ranges
 
 import numpy as np
 import pickle
+from collections import defaultdict
 from datetime import datetime
 
 class UncertaintyQuantifier:
     """Add uncertainty quantification to predictions"""
     
     def __init__(self, model_path='final_rainfall_classifier_v1.pkl', 
-                 taluk_models_path='taluk_models.pkl'):
-        """Load models for ensemble predictions"""
+                 taluk_models_path='taluk_models.pkl',
+                 district_model=None, taluk_models=None):
+        """Load models for ensemble predictions (or reuse already-loaded ones)"""
         
-        with open(model_path, 'rb') as f:
-            self.district_model = pickle.load(f)
+        if district_model is not None:
+            self.district_model = district_model
+        else:
+            with open(model_path, 'rb') as f:
+                self.district_model = pickle.load(f)
+        
+        # Labels in predict_proba column order (sklearn sorts them: Deficit, Excess, Normal)
+        self._categories = self.district_model.classes_.tolist()
+        self._dne = tuple(self._categories.index(c) for c in ('Deficit', 'Normal', 'Excess'))
         
+        if taluk_models is not None:
+            self.taluk_models = taluk_models
+            return
         try:
             with open(taluk_models_path, 'rb') as f:
                 self.taluk_models = pickle.load(f)
@@ -31,19 +43,41 @@ class UncertaintyQuantifier:
         Returns:
             dict with prediction + uncertainty bounds
         """
+        # Accept a feature list or a schema-ordered row
+        X = np.asarray(features, dtype=np.float32).reshape(1, -1)
+        return self.get_predictions_with_uncertainty(X, [taluk])[0]
+    
+    def get_predictions_with_uncertainty(self, X, taluks):
+        """
+        Batch version: one predict_proba call per model for all rows
+        (rows are grouped by taluk for the taluk models)
         
-        # Get district model prediction
-        district_proba = self.district_model.predict_proba([features])[0]
+        Returns:
+            list of dicts, one per row of X
+        """
+        X = np.asarray(X, dtype=np.float32)  # trees split on float32
         
-        predictions = [district_proba]
+        # Get district model prediction
+        district_proba = self.district_model.predict_proba(X)
         
         # Add taluk model prediction if available
-        if self.taluk_models and taluk and taluk in self.taluk_models:
-            taluk_proba = self.taluk_models[taluk].predict_proba([features])[0]
-            predictions.append(taluk_proba)
-        
-        # Stack predictions
-        ensemble_preds = np.array(predictions)
+        taluk_proba = [None] * len(X)
+        if self.taluk_models:
+            rows_by_taluk = defaultdict(list)
+            for i, taluk in enumerate(taluks):
+                if taluk and taluk in self.taluk_models:
+                    rows_by_taluk[taluk].append(i)
+            for taluk, rows in rows_by_taluk.items():
+                for i, proba in zip(rows, self.taluk_models[taluk].predict_proba(X[rows])):
+                    taluk_proba[i] = proba
+        
+        return [
+            self._summarize(np.array([district] if local is None else [district, local]))
+            for district, local in zip(district_proba, taluk_proba)
+        ]
+    
+    def _summarize(self, ensemble_preds):
+        """Prediction + uncertainty bounds from stacked per-model probabilities"""
         
         # Calculate statistics
         mean_probs = np.mean(ensemble_preds, axis=0)
@@ -53,16 +87,21 @@ class UncertaintyQuantifier:
         lower_bound = np.clip(mean_probs - 1.645 * std_probs, 0, 1)
         upper_bound = np.clip(mean_probs + 1.645 * std_probs, 0, 1)
         
-        # Determine prediction
-        category_idx = np.argmax(mean_probs)
-        categories = ['Deficit', 'Normal', 'Excess']
-        predicted_category = categories[category_idx]
+        # Determine prediction: label comes straight from the argmax over classes_
+        category_idx = int(np.argmax(mean_probs))
+        predicted_category = self._categories[category_idx]
+        d, n, e = self._dne
+        
+        # One bulk conversion to Python floats (percent) instead of per-element NumPy scalars
+        mean_pct = (mean_probs * 100).tolist()
+        lower_pct = (lower_bound * 100).tolist()
+        upper_pct = (upper_bound * 100).tolist()
         
         # Confidence (probability of predicted class)
-        confidence = mean_probs[category_idx] * 100
+        confidence = mean_pct[category_idx]
         
         # Uncertainty level
-        avg_std = np.mean(std_probs) * 100
+        avg_std = float(np.mean(std_probs)) * 100
         if avg_std < 5:
             uncertainty_level = 'LOW'
             uncertainty_desc = 'Models agree strongly'
@@ -78,9 +117,9 @@ class UncertaintyQuantifier:
                 'category': predicted_category,
                 'confidence': confidence,
                 'probabilities': {
-                    'deficit': mean_probs[0] * 100,
-                    'normal': mean_probs[1] * 100,
-                    'excess': mean_probs[2] * 100
+                    'deficit': mean_pct[d],
+                    'normal': mean_pct[n],
+                    'excess': mean_pct[e]
                 }
             },
             'uncertainty': {
@@ -90,24 +129,13 @@ class UncertaintyQuantifier:
                 'model_agreement': 100 - avg_std  # Higher = better agreement
             },
             'prediction_intervals': {
-                'deficit': {
-                    'mean': mean_probs[0] * 100,
-                    'lower_90': lower_bound[0] * 100,
-                    'upper_90': upper_bound[0] * 100,
-                    'range': f"{lower_bound[0]*100:.0f}-{upper_bound[0]*100:.0f}%"
-                },
-                'normal': {
-                    'mean': mean_probs[1] * 100,
-                    'lower_90': lower_bound[1] * 100,
-                    'upper_90': upper_bound[1] * 100,
-                    'range': f"{lower_bound[1]*100:.0f}-{upper_bound[1]*100:.0f}%"
-                },
-                'excess': {
-                    'mean': mean_probs[2] * 100,
-                    'lower_90': lower_bound[2] * 100,
-                    'upper_90': upper_bound[2] * 100,
-                    'range': f"{lower_bound[2]*100:.0f}-{upper_bound[2]*100:.0f}%"
+                label: {
+                    'mean': mean_pct[i],
+                    'lower_90': lower_pct[i],
+                    'upper_90': upper_pct[i],
+                    'range': f"{lower_pct[i]:.0f}-{upper_pct[i]:.0f}%"
                 }
+                for label, i in (('deficit', d), ('normal', n), ('excess', e))
             },
             'interpretation': self._get_interpretation(
                 predicted_category, confidence, uncertainty_level
@@ -1,8 +1,9 @@
 from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, field_validator
 from typing import Optional
 from datetime import datetime
@@ -10,7 +11,7 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import logging
-import json
+import orjson
 import os
 from pathlib import Path
 from app.config import settings
@@ -85,6 +86,42 @@ class HealthResponse(BaseModel):
     timestamp: str
 
 # ==================== FASTAPI APP ====================
+async def prime_forecast_cache_loop(mapper):
+    """
+    Background warm loop: refresh forecasts for taluk centres and every
+    farmer location looked up within the cache TTL before the entries expire.
+    This is the same cache get_live_forecast_safe reads on the request path.
+    """
+    while True:
+        try:
+            coordinates = [
+                (data['center']['lat'], data['center']['lon'])
+                for data in mapper.boundaries.values()
+            ] + AdvisoryService._forecast_cache.locations()
+            
+            primed = await asyncio.to_thread(AdvisoryService().prime_cache, coordinates)
+            logger.info(
+                f"🌦️ Forecast cache primed: {primed}/{len(coordinates)} locations, "
+                f"stats={AdvisoryService._forecast_cache.stats()}"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Forecast cache priming failed: {e}")
+        
+        await asyncio.sleep(settings.FORECAST_PRIME_INTERVAL_SECONDS)
+
+async def flush_predictions_loop():
+    """
+    Background flush loop: write buffered prediction records to disk on a
+    timer, so an idle server does not hold them in memory until shutdown.
+    """
+    from app.monitoring.quality import PerformanceTracker, get_performance_tracker
+    while True:
+        await asyncio.sleep(PerformanceTracker.FLUSH_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(get_performance_tracker().flush)
+        except Exception as e:
+            logger.warning(f"⚠️ Prediction log flush failed: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -105,12 +142,23 @@ async def lifespan(app: FastAPI):
         # We don't raise here to allow health check to report failure if needed, 
         # or we could crash hard. For now, let's log critical error.
     
+    # Keep the forecast cache warm so farmer requests skip the network
+    prime_task = None
+    if settings.ENABLE_CACHE and settings.FORECAST_PRIME_INTERVAL_SECONDS > 0 and getattr(app.state, 'mapper', None):
+        prime_task = asyncio.create_task(prime_forecast_cache_loop(app.state.mapper))
+    
+    # Prediction log writes are buffered; flush them even when no requests arrive
+    flush_task = asyncio.create_task(flush_predictions_loop())
+    
     logger.info("=" * 60)
     
     yield
     
     # Shutdown
     logger.info("🛑 Rainfall Advisory API Shutting Down")
+    if prime_task:
+        prime_task.cancel()
+    flush_task.cancel()
     # Clear resources if needed
     app.state.mapper = None
     app.state.engineer = None
@@ -136,7 +184,8 @@ app = FastAPI(
     version="1.2",
     description="ML-powered rainfall prediction and farmer advisory system",
     debug=DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson: faster encoding, handles numpy scalars
 )
 
 # Add Gzip compression for faster responses
@@ -224,7 +273,8 @@ def get_metrics():
             "status": "operational",
             "version": "1.2",
             "drift_alerts_24h": drift_summary,
-            "performance": perf_metrics
+            "performance": perf_metrics,
+            "forecast_cache": AdvisoryService._forecast_cache.stats()
         }
     except Exception as e:
         logger.error(f"Metrics error: {e}")
@@ -344,7 +394,7 @@ async def get_advisory(request: Request, advisory_request: AdvisoryRequest):
             "alert_sent": alert_shown,
             "processing_time_ms": (datetime.now() - start_time).total_seconds() * 1000
         }
-        prediction_logger.info(json.dumps(prediction_log_entry))
+        prediction_logger.info(orjson.dumps(prediction_log_entry).decode())
         
         logger.info(f"Advisory complete for {advisory_request.user_id}: {main_prediction}")
         
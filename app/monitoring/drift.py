@@ -1,13 +1,15 @@
 import pandas as pd
-import numpy as np
 import json
 from datetime import datetime
 from pathlib import Path
-from scipy import stats
 import os
 from ..config import settings
 BASE_DIR = Path(settings.BASE_DIR)
 
+# Features whose production values are compared with the training distribution
+DRIFT_FEATURES = ['rain_lag_7', 'rain_lag_30', 'rolling_30_rain', 
+                  'temp', 'humidity', 'wind', 'pressure', 'month']
+
 class DriftDetector:
     """
     Monitors input data drift using statistical tests
@@ -24,12 +26,8 @@ class DriftDetector:
              if os.path.exists(fallback):
                 training_data_path = fallback
             
-        try:
-            self.training_data = pd.read_csv(training_data_path)
-        except FileNotFoundError:
-            # Fallback for testing/CI if no data
-            print(f"Warning: Training data {training_data_path} not found. Drift detection disabled.")
-            self.training_data = pd.DataFrame(columns=['rainfall_last_30d', 'monsoon_intensity', 'month_sin', 'month_cos'])
+        self.training_data_path = training_data_path
+        self.training_data = None  # Only read when the stats cache is missing
         
         self.stats_file = BASE_DIR / "app/monitoring/training_stats.json"
         self.drift_log = BASE_DIR / "app/monitoring/drift_alerts.log"
@@ -40,6 +38,20 @@ class DriftDetector:
         # Compute training statistics
         self._compute_training_stats()
     
+    def _load_training_data(self):
+        """Typed read of just the monitored columns (skips dtype inference on the rest)"""
+        try:
+            return pd.read_csv(
+                self.training_data_path,
+                engine='c',
+                usecols=DRIFT_FEATURES,
+                dtype={feature: 'float64' for feature in DRIFT_FEATURES}
+            )
+        except FileNotFoundError:
+            # Fallback for testing/CI if no data
+            print(f"Warning: Training data {self.training_data_path} not found. Drift detection disabled.")
+            return pd.DataFrame(columns=['rainfall_last_30d', 'monsoon_intensity', 'month_sin', 'month_cos'])
+    
     def _compute_training_stats(self):
         """Compute mean, std, min, max for each feature"""
         if self.stats_file.exists():
@@ -47,8 +59,8 @@ class DriftDetector:
                 self.training_stats = json.load(f)
             return
         
-        features = ['rain_lag_7', 'rain_lag_30', 'rolling_30_rain', 
-                   'temp', 'humidity', 'wind', 'pressure', 'month']
+        self.training_data = self._load_training_data()
+        features = DRIFT_FEATURES
         
         stats_dict = {}
         for feature in features:
@@ -1,5 +1,8 @@
-import pandas as pd
 import json
+import orjson
+import atexit
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
@@ -12,16 +15,93 @@ class PerformanceTracker:
     Log predictions and (when available) ground truth
     Calculate accuracy metrics
     """
+    FLUSH_INTERVAL_SECONDS = 5
     
-    def __init__(self):
-        self.predictions_db = BASE_DIR / "app/monitoring/predictions_db.jsonl"
-        self.metrics_file = BASE_DIR / "app/monitoring/performance_metrics.json"
+    def __init__(self, predictions_db=None, metrics_file=None):
+        self.predictions_db = Path(predictions_db or BASE_DIR / "app/monitoring/predictions_db.jsonl")
+        self.metrics_file = Path(metrics_file or BASE_DIR / "app/monitoring/performance_metrics.json")
         
         self.predictions_db.parent.mkdir(exist_ok=True, parents=True)
+        
+        # One buffered append handle for the process instead of open/close per request
+        self._fh = None
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        atexit.register(self.close)
+        
+        # Running aggregates, seeded from the existing log on first use
+        self._agg = None
+    
+    @staticmethod
+    def _confidence_score(conf, category):
+        """Confidence of the predicted category from a logged record"""
+        if isinstance(conf, dict):
+            return conf.get(category, 0)
+        if isinstance(conf, (int, float)):
+            # Legacy format support
+            val = float(conf)
+            return val / 100.0 if val > 1.0 else val
+        return None
+    
+    def _add_to_agg(self, record):
+        """Fold one prediction record into the running aggregates (lock held)"""
+        agg = self._agg
+        category = record['prediction']
+        agg['total'] += 1
+        agg['categories'][category] += 1
+        agg['alerts'] += 1 if record['alert_sent'] else 0
+        
+        score = self._confidence_score(record.get('confidence', {}), category)
+        if score is not None:
+            agg['conf_sum'][category] += score
+            agg['conf_n'][category] += 1
+        
+        taluk = agg['taluks'][record['taluk']]
+        taluk['count'] += 1
+        taluk['categories'][category] += 1
+    
+    def _ensure_agg(self):
+        """Build the aggregates from the log once; later predictions update them in place"""
+        if self._agg is not None:
+            return
+        self._agg = {
+            'total': 0,
+            'categories': defaultdict(int),
+            'alerts': 0,
+            'conf_sum': defaultdict(float),
+            'conf_n': defaultdict(int),
+            'taluks': defaultdict(lambda: {'count': 0, 'categories': defaultdict(int)})
+        }
+        if self._fh:
+            self._fh.flush()
+        if not self.predictions_db.exists():
+            return
+        with open(self.predictions_db, 'rb') as f:
+            for line in f:
+                try:
+                    self._add_to_agg(orjson.loads(line))
+                except:
+                    continue
+    
+    def flush(self):
+        """Push buffered records to disk"""
+        with self._lock:
+            if self._fh:
+                self._fh.flush()
+            self._last_flush = time.monotonic()
+    
+    def close(self):
+        with self._lock:
+            if self._fh:
+                self._fh.close()
+                self._fh = None
     
     def log_prediction(self, user_id, taluk, features, prediction, confidence, alert_sent):
         """
-        Log a prediction for future performance analysis
+        Log a prediction for future performance analysis.
+        Records are buffered: the API's flush loop writes them out every
+        FLUSH_INTERVAL_SECONDS, and close() at exit. Records logged since the
+        last flush are lost if the process is killed (SIGKILL, OOM).
         """
         record = {
             'timestamp': datetime.now().isoformat(),
@@ -34,8 +114,21 @@ class PerformanceTracker:
             'ground_truth': None  # Will be updated later if available
         }
         
-        with open(self.predictions_db, 'a') as f:
-            f.write(json.dumps(record) + '\n')
+        # numpy scalars can reach us via the confidence dict
+        line = orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+        
+        with self._lock:
+            self._ensure_agg()
+            self._add_to_agg(record)
+            
+            if self._fh is None:
+                self._fh = open(self.predictions_db, 'ab', buffering=1 << 16)
+            self._fh.write(line)
+            
+            now = time.monotonic()
+            if now - self._last_flush >= self.FLUSH_INTERVAL_SECONDS:
+                self._fh.flush()
+                self._last_flush = now
     
     def update_ground_truth(self, user_id, timestamp, actual_category):
         """
@@ -60,60 +153,29 @@ class PerformanceTracker:
         Calculate performance metrics from logged predictions
         (Only for predictions where ground truth is available)
         """
-        if not self.predictions_db.exists():
+        with self._lock:
+            self._ensure_agg()
+            agg = self._agg
+            total_predictions = agg['total']
+            category_counts = dict(agg['categories'])
+            alerts_sent = agg['alerts']
+            avg_confidences = {
+                category: agg['conf_sum'][category] / agg['conf_n'][category]
+                for category in ['Deficit', 'Normal', 'Excess']
+                if agg['conf_n'].get(category)
+            }
+        
+        if not total_predictions:
             return {
                 "status": "no_data",
                 "message": "No predictions logged yet"
             }
         
-        # Load predictions
-        predictions = []
-        with open(self.predictions_db, 'r') as f:
-            for line in f:
-                try:
-                    predictions.append(json.loads(line))
-                except:
-                    continue
-        
-        if not predictions:
-            return {"status": "no_data"}
-        
-        # Calculate basic stats
-        total_predictions = len(predictions)
-        
-        # Count by category
-        category_counts = defaultdict(int)
-        for pred in predictions:
-            category_counts[pred['prediction']] += 1
-        
-        # Count alerts sent
-        alerts_sent = sum(1 for p in predictions if p['alert_sent'])
-        
-        # Average confidence scores
-        avg_confidences = {}
-        for category in ['Deficit', 'Normal', 'Excess']:
-            cat_preds = [p for p in predictions if p['prediction'] == category]
-            cat_preds = [p for p in predictions if p['prediction'] == category]
-            if cat_preds:
-                valid_scores = []
-                for p in cat_preds:
-                    conf = p.get('confidence', {})
-                    if isinstance(conf, dict):
-                         valid_scores.append(conf.get(category, 0))
-                    elif isinstance(conf, (int, float)):
-                         # Legacy format support
-                         val = float(conf)
-                         if val > 1.0: val /= 100.0
-                         valid_scores.append(val)
-                
-                if valid_scores:
-                    avg_confidences[category] = sum(valid_scores) / len(valid_scores)
-        
         metrics = {
             'timestamp': datetime.now().isoformat(),
             'period_days': last_n_days,
             'total_predictions': total_predictions,
-            'category_distribution': dict(category_counts),
+            'category_distribution': category_counts,
             'alerts_sent': alerts_sent,
             'alert_rate': alerts_sent / total_predictions if total_predictions > 0 else 0,
             'avg_confidence_scores': avg_confidences
@@ -135,22 +197,12 @@ class PerformanceTracker:
     
     def get_prediction_stats_by_taluk(self):
         """Get prediction breakdown by taluk"""
-        if not self.predictions_db.exists():
-            return {}
-        
-        taluk_stats = defaultdict(lambda: {'count': 0, 'categories': defaultdict(int)})
-        
-        with open(self.predictions_db, 'r') as f:
-            for line in f:
-                try:
-                    pred = json.loads(line)
-                    taluk = pred['taluk']
-                    taluk_stats[taluk]['count'] += 1
-                    taluk_stats[taluk]['categories'][pred['prediction']] += 1
-                except:
-                    continue
-        
-        return dict(taluk_stats)
+        with self._lock:
+            self._ensure_agg()
+            return {
+                taluk: {'count': stats['count'], 'categories': dict(stats['categories'])}
+                for taluk, stats in self._agg['taluks'].items()
+            }
 
 # Global tracker instance
 performance_tracker = None
@@ -9,10 +9,6 @@ from sklearn.neighbors import KNeighborsClassifier
 from sklearn.metrics import accuracy_score, classification_report
 from sklearn.preprocessing import StandardScaler
 
-# Load Data
-data_path = 'data/training_table_v2_CORRECTED.csv'
-df = pd.read_csv(data_path)
-
 # Features & Target
 features = [
     'rain_lag_7', 'rain_lag_30', 'rolling_30_rain', 'rolling_60_rain', 
@@ -21,11 +17,19 @@ features = [
 ]
 target = 'target_category'
 
-X = df[features]
-y = df[target]
+# Load Data (typed, only the columns we use)
+data_path = 'data/training_table_v2_CORRECTED.csv'
+df = pd.read_csv(
+    data_path,
+    engine='c',
+    usecols=features + [target],
+    dtype={**{f: np.float32 for f in features}, target: 'category'}
+)
 
-# Handle basic cleaning (fill NaNs if any)
-X = X.fillna(0)
+# Handle basic cleaning (fill NaNs if any); trees split on float32 internally,
+# so hand them a contiguous float32 matrix instead of letting each fit copy one
+X = df[features].fillna(0).to_numpy(dtype=np.float32)
+y = df[target]
 
 # Split data
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -1,19 +1,66 @@
-
 import pickle
 import sys
 import os
 
 model_path = 'models/final_rainfall_classifier_v1.pkl'
+onnx_path = 'models/final_rainfall_classifier_v1.onnx'
+
+# Optional one-off export: python inspect_model.py --export-onnx
+# (needs skl2onnx; the API itself keeps serving the pickle)
+if '--export-onnx' in sys.argv:
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+
+        with open(model_path, 'rb') as f:
+            model = pickle.load(f)
+
+        onnx_model = convert_sklearn(
+            model,
+            initial_types=[('features', FloatTensorType([None, model.n_features_in_]))],
+            options={id(model): {'zipmap': False}}
+        )
+        onnx_model.doc_string = type(model).__name__
+        with open(onnx_path, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+        print(f"Exported {onnx_path}")
+    except Exception as e:
+        print(f"Error exporting ONNX model: {e}")
+    sys.exit(0)
+
+# Prefer ONNX metadata: reads the graph header without unpickling sklearn
+if os.path.exists(onnx_path):
+    try:
+        import onnx
+
+        m = onnx.load_model(onnx_path)
+        print(f"Model Type: {m.doc_string or m.graph.name} (ONNX)")
+        print(f"Producer: {m.producer_name} {m.producer_version}")
+        print(f"Model Version: {m.model_version}")
+        print(f"Opset: {[(o.domain or 'ai.onnx', o.version) for o in m.opset_import]}")
+        print(f"Inputs: {[i.name for i in m.graph.input]}")
+        print(f"Outputs: {[o.name for o in m.graph.output]}")
+
+        tree_nodes = [n for n in m.graph.node if n.op_type.startswith('TreeEnsemble')]
+        for node in tree_nodes:
+            for attr in node.attribute:
+                if attr.name == 'nodes_treeids':
+                    print(f"Number of Estimators: {len(set(attr.ints))}")
+        sys.exit(0)
+    except ImportError:
+        pass  # onnx not installed -> fall back to the pickle
+    except Exception as e:
+        print(f"Error reading ONNX model: {e}")
 
 try:
     with open(model_path, 'rb') as f:
         model = pickle.load(f)
-    
+
     print(f"Model Type: {type(model)}")
     print(f"Model Parameters: {model.get_params()}")
-    
+
     if hasattr(model, 'estimators_'):
         print(f"Number of Estimators: {len(model.estimators_)}")
-        
+
 except Exception as e:
     print(f"Error loading model: {e}")
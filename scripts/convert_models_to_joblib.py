@@ -0,0 +1,35 @@
+import os
+import sys
+import pickle
+import joblib
+
+# Add parent directory to path to access config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+# One-off: write uncompressed .joblib copies of the model pickles.
+# RainfallPredictor loads them with mmap_mode='r' when present.
+SOURCES = [settings.DISTRICT_MODEL_PATH, settings.TALUK_MODELS_PATH]
+
+def convert():
+    print("="*60)
+    print("🚀 Converting model pickles to joblib")
+    print("="*60)
+
+    for pkl_path in SOURCES:
+        if not pkl_path.exists():
+            print(f"❌ File not found: {pkl_path}")
+            continue
+
+        with open(pkl_path, 'rb') as f:
+            model = pickle.load(f)
+
+        joblib_path = pkl_path.with_suffix('.joblib')
+        joblib.dump(model, joblib_path, compress=False)  # mmap needs uncompressed arrays
+        print(f"✅ {pkl_path.name} -> {joblib_path.name}")
+
+    print("\n🎉 Conversion Complete!")
+
+if __name__ == "__main__":
+    convert()
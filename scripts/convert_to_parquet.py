@@ -0,0 +1,34 @@
+import os
+import sys
+import pandas as pd
+
+# Add parent directory to path to access config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+# One-off: write typed, (taluk, date)-sorted Parquet copies of the history CSVs.
+# FeatureEngineer picks them up automatically when pyarrow is installed.
+SOURCES = [settings.RAINFALL_DATA_PATH, settings.WEATHER_DATA_PATH]
+
+def convert():
+    print("="*60)
+    print("🚀 Converting history CSVs to Parquet")
+    print("="*60)
+
+    for csv_path in SOURCES:
+        if not csv_path.exists():
+            print(f"❌ File not found: {csv_path}")
+            continue
+
+        df = pd.read_csv(csv_path, engine='c', parse_dates=['date'], date_format='ISO8601')
+        df = df.sort_values(['taluk', 'date'], kind='stable', ignore_index=True)
+
+        parquet_path = csv_path.with_suffix('.parquet')
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        print(f"✅ {csv_path.name} -> {parquet_path.name} ({len(df)} rows)")
+
+    print("\n🎉 Conversion Complete!")
+
+if __name__ == "__main__":
+    convert()
@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import pandas as pd
@@ -14,6 +15,12 @@ import getpass
 default_user = getpass.getuser()
 DATABASE_URL = os.getenv("DATABASE_URL", f"postgresql://{default_user}@localhost:5432/rainfall_db")
 
+# Rows per read_csv/to_sql chunk: peak memory is bounded by this, not the file size
+CHUNK_ROWS = 50_000
+# Rows per multi-row INSERT on the non-COPY fallback (kept under SQLite's
+# 32766 bound-parameter limit for the 6-column weather table)
+INSERT_ROWS = 5_000
+
 Base = declarative_base()
 
 class RainfallHistory(Base):
@@ -41,6 +48,47 @@ class WeatherDrivers(Base):
     # Index for fast lookups
     __table_args__ = (Index('idx_weather_taluk_date', 'taluk', 'date'),)
 
+def bulk_insert(engine, table, df):
+    """
+    Append one chunk with COPY FROM STDIN (PostgreSQL via psycopg2);
+    other drivers fall back to pandas INSERTs.
+    """
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if not hasattr(cursor, 'copy_expert'):
+            # Multi-row VALUES statements instead of one INSERT per row
+            df.to_sql(table, engine, if_exists='append', index=False,
+                      chunksize=INSERT_ROWS, method='multi')
+            return
+        
+        buf = io.StringIO()
+        df.to_csv(buf, index=False, header=False)
+        buf.seek(0)
+        cursor.copy_expert(f"COPY {table} ({', '.join(df.columns)}) FROM STDIN WITH CSV", buf)
+        raw.commit()
+    finally:
+        raw.close()
+
+def bulk_load(engine, model, chunks):
+    """
+    Load DataFrame chunks into an empty table. Its indexes are dropped during
+    the load and rebuilt once at the end instead of being updated per row.
+    """
+    table = model.__table__
+    for index in table.indexes:
+        index.drop(engine, checkfirst=True)
+    
+    total = 0
+    try:
+        for df in chunks:
+            bulk_insert(engine, table.name, df)
+            total += len(df)
+            print(f"  ... {total} rows inserted into {table.name}")
+    finally:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
 def migrate():
     print("="*60)
     print("🚀 Starting Database Migration")
@@ -63,21 +111,23 @@ def migrate():
     rainfall_csv = "rainfall_daily_historical_v1.csv"
     if os.path.exists(rainfall_csv):
         print(f"\nProcessing {rainfall_csv}...")
-        df = pd.read_csv(rainfall_csv)
-        
-        # Standardize columns
-        # CSV: date, taluk, rainfall
-        # DB: date, taluk, rainfall_mm
-        df = df.rename(columns={'rainfall': 'rainfall_mm'})
-        df['date'] = pd.to_datetime(df['date'], format='mixed').dt.date
         
         # Check if data already exists
         count = session.query(RainfallHistory).count()
         if count > 0:
             print(f"⚠️  Rainfall table already has {count} rows. Skipping insertion.")
         else:
-            print(f"Insertion {len(df)} rows into rainfall_history...")
-            df.to_sql('rainfall_history', engine, if_exists='append', index=False, chunksize=1000)
+            # Stream the CSV in chunks instead of loading it whole
+            def chunks():
+                for df in pd.read_csv(rainfall_csv, chunksize=CHUNK_ROWS):
+                    # Standardize columns
+                    # CSV: date, taluk, rainfall
+                    # DB: date, taluk, rainfall_mm
+                    df = df.rename(columns={'rainfall': 'rainfall_mm'})
+                    df['date'] = pd.to_datetime(df['date'], format='ISO8601').dt.date
+                    yield df
+            
+            bulk_load(engine, RainfallHistory, chunks())
             print("✅ Rainfall data migrated.")
     else:
         print(f"❌ File not found: {rainfall_csv}")
@@ -86,20 +136,21 @@ def migrate():
     weather_csv = "weather_drivers_daily_v1.csv"
     if os.path.exists(weather_csv):
         print(f"\nProcessing {weather_csv}...")
-        df = pd.read_csv(weather_csv)
-        
-        # Standardize columns
-        # CSV: date, temp, humidity, wind, pressure, taluk
-        # DB matches exactly (except 'date' type)
-        df['date'] = pd.to_datetime(df['date'], format='mixed').dt.date
         
         # Check if data already exists
         count = session.query(WeatherDrivers).count()
         if count > 0:
             print(f"⚠️  Weather table already has {count} rows. Skipping insertion.")
         else:
-            print(f"Insertion {len(df)} rows into weather_drivers...")
-            df.to_sql('weather_drivers', engine, if_exists='append', index=False, chunksize=1000)
+            def chunks():
+                for df in pd.read_csv(weather_csv, chunksize=CHUNK_ROWS):
+                    # Standardize columns
+                    # CSV: date, temp, humidity, wind, pressure, taluk
+                    # DB matches exactly (except 'date' type)
+                    df['date'] = pd.to_datetime(df['date'], format='ISO8601').dt.date
+                    yield df
+            
+            bulk_load(engine, WeatherDrivers, chunks())
             print("✅ Weather data migrated.")
     else:
         print(f"❌ File not found: {weather_csv}")
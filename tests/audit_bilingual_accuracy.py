@@ -1,6 +1,7 @@
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8000"
 
@@ -25,6 +26,7 @@ def check_for_bilingual_dicts(obj, path=""):
     return errors
 
 def audit_endpoint(endpoint, crop, lang):
+    """Run one scenario; returns (success, report lines) so parallel runs print in order"""
     url = f"{BASE_URL}/{endpoint}"
     payload = {
         "user_id": f"audit_{lang}_{crop}",
@@ -35,23 +37,20 @@ def audit_endpoint(endpoint, crop, lang):
         "language": lang
     }
     
-    print(f"  Testing {endpoint} | Crop: {crop:10} | Lang: {lang} ... ", end="", flush=True)
+    label = f"  Testing {endpoint} | Crop: {crop:10} | Lang: {lang} ... "
     try:
         response = requests.post(url, json=payload, timeout=15)
         if response.status_code != 200:
-            print(f"❌ FAILED (Status {response.status_code})")
-            print(f"    Detail: {response.text}")
-            return False
+            return False, [label + f"❌ FAILED (Status {response.status_code})",
+                           f"    Detail: {response.text}"]
             
         data = response.json()
         
         # 1. Check for Leaked Bilingual Dicts
         leaks = check_for_bilingual_dicts(data)
         if leaks:
-            print("❌ FAILED (Localization Leaks)")
-            for leak in leaks[:3]: # Show first 3
-                print(f"    - {leak}")
-            return False
+            return False, [label + "❌ FAILED (Localization Leaks)"] + \
+                          [f"    - {leak}" for leak in leaks[:3]]  # Show first 3
             
         # 2. Basic Content Check (e.g. if we requested 'kn', is there any Kannada text where expected?)
         if lang == "kn":
@@ -60,15 +59,12 @@ def audit_endpoint(endpoint, crop, lang):
              # Kannada unicode range: \u0C80-\u0CFF
              has_kn = any('\u0c80' <= char <= '\u0cff' for char in str(msg))
              if not has_kn:
-                 print("❌ FAILED (No Kannada script found in message)")
-                 return False
+                 return False, [label + "❌ FAILED (No Kannada script found in message)"]
                  
-        print("✅ PASSED")
-        return True
+        return True, [label + "✅ PASSED"]
 
     except Exception as e:
-        print(f"💥 ERROR: {e}")
-        return False
+        return False, [label + f"💥 ERROR: {e}"]
 
 def run_audit():
     print("="*60)
@@ -77,11 +73,13 @@ def run_audit():
     
     all_success = True
     
-    for endpoint in ["get-advisory", "get-enhanced-advisory"]:
-        print(f"\n--- Endpoint: {endpoint} ---")
-        for lang in LANGUAGES:
-            for crop in CROPS:
-                success = audit_endpoint(endpoint, crop, lang)
+    # Requests are I/O-bound: run every scenario concurrently, report in order
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for endpoint in ["get-advisory", "get-enhanced-advisory"]:
+            print(f"\n--- Endpoint: {endpoint} ---")
+            scenarios = [(crop, lang) for lang in LANGUAGES for crop in CROPS]
+            for success, lines in pool.map(lambda s: audit_endpoint(endpoint, *s), scenarios):
+                print("\n".join(lines))
                 if not success:
                     all_success = False
                     
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+Models, history tables and the API client are built once per test session
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+@pytest.fixture(scope="session")
+def mapper():
+    from app.backend import TalukMapper
+    return TalukMapper()
+
+
+@pytest.fixture(scope="session")
+def feature_engineer():
+    from app.backend import FeatureEngineer
+    return FeatureEngineer()
+
+
+@pytest.fixture(scope="session")
+def predictor():
+    from app.backend import RainfallPredictor
+    return RainfallPredictor()
+
+
+@pytest.fixture(scope="session")
+def api_client(mapper, feature_engineer, predictor):
+    """
+    One TestClient for the whole session. Entering it runs the app's startup
+    (singleton warmup) once; the background forecast priming loop is switched
+    off so its requests never hit a test's mocked HTTP session. One pipeline
+    request then warms the lazy paths (feature indexes, first model call)
+    before any test is timed.
+    """
+    from fastapi.testclient import TestClient
+    from app.backend import process_advisory_request
+    from app.config import settings
+    from app.main import app
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "FORECAST_PRIME_INTERVAL_SECONDS", 0)
+        with TestClient(app) as client:
+            process_advisory_request('warmup', 13.34, 74.74, '2025-06-15',
+                                     mapper=mapper, engineer=feature_engineer, predictor=predictor)
+            yield client
@@ -1,26 +1,22 @@
 import pytest
-from fastapi.testclient import TestClient
 import sys
 import os
 
 # Add parent directory to path to import api_server
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from app.main import app
 
-client = TestClient(app)
-
-def test_root_endpoint():
+def test_root_endpoint(api_client):
     """Test root endpoint returns service info"""
-    response = client.get("/")
+    response = api_client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert data["service"] == "Rainfall Advisory API"
     assert "version" in data
 
-def test_health_check():
+def test_health_check(api_client):
     """Test health endpoint"""
-    response = client.get("/health")
+    response = api_client.get("/health")
     # Health check might fail if server isn't running in a way that mocks can handle properly, 
     # but here we use TestClient with app instance, so it should be fine.
     assert response.status_code == 200
@@ -28,9 +24,9 @@ def test_health_check():
     assert data["status"] == "healthy"
     assert "version" in data
 
-def test_metrics_endpoint():
+def test_metrics_endpoint(api_client):
     """Test metrics endpoint"""
-    response = client.get("/metrics")
+    response = api_client.get("/metrics")
     assert response.status_code == 200
     data = response.json()
     assert "total_predictions" in data
@@ -9,11 +9,13 @@ import numpy as np
 from datetime import datetime
 import sys
 import os
+import threading
+from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from app.backend import process_advisory_request
+from app.backend import process_advisory_request, process_advisory_batch
 
 class TestProductionBackend:
     """Test production backend functions"""
@@ -90,7 +92,85 @@ class TestProductionBackend:
         assert taluk is not None
         # Backend capitalizes names
         assert taluk in ['Udupi', 'Kundapura', 'Karkala', 'Hebri', 'Brahmavara', 'Kapu', 'Byndoor']
+    
+    def test_feature_array_matches_schema_order(self, feature_engineer):
+        """Array path returns the same features as the dict, in schema order"""
+        features = feature_engineer.compute_features('udupi', '2025-06-15')
+        row = feature_engineer.compute_features_array('udupi', '2025-06-15')
+        schema = feature_engineer.schema['features']
+        
+        assert row.shape == (1, len(schema))
+        assert row.dtype == np.float32
+        assert row[0].tolist() == np.float32([features[f] for f in schema]).tolist()
+    
+    def test_batch_matches_single_requests(self):
+        """Batch path gives the same predictions as one-by-one, and isolates bad rows"""
+        batch = [
+            ('u1', 13.3409, 74.7421, '2025-06-15'),
+            ('u2', 999, 74.7421, '2025-06-15'),       # bad GPS
+            ('u3', 13.2108, 74.9896, '2024-11-02'),
+            ('u4', 13.3409, 74.7421, 'not-a-date'),   # bad date
+        ]
+        results = process_advisory_batch(batch)
+        
+        assert [r['status'] for r in results] == ['success', 'error', 'success', 'error']
+        for request, result in zip(batch, results):
+            single = process_advisory_request(*request)
+            assert single['status'] == result['status']
+            if result['status'] == 'success':
+                assert single['rainfall']['monthly_prediction'] == result['rainfall']['monthly_prediction']
 
+    def test_taluk_batch_matches_single_lookup(self, mapper):
+        """Vectorized GPS mapping agrees with get_taluk, errors included"""
+        lats = np.linspace(12.4, 14.6, 23)
+        lons = np.linspace(74.3, 75.4, 23)
+        points = [(float(la), float(lo)) for la in lats for lo in lons] + [(999.0, 74.7)]
+        
+        results = mapper.get_taluks_batch([p[0] for p in points], [p[1] for p in points])
+        for (lat, lon), result in zip(points, results):
+            try:
+                expected = mapper.get_taluk(lat, lon)
+            except Exception as e:
+                assert type(result) is type(e) and str(result) == str(e)
+            else:
+                assert result == expected
+    
+    def test_weather_fetches_run_concurrently(self):
+        """Forecast round-trips overlap each other"""
+        # Every fetch waits until all four are in flight; run serially, the barrier times out
+        in_flight = threading.Barrier(4, timeout=5)
+        overlapped = []
+        
+        def slow_forecast(lat, lon):
+            try:
+                in_flight.wait()
+                overlapped.append(True)
+            except threading.BrokenBarrierError:
+                overlapped.append(False)
+            return 12.0, 1.0, [2.0] * 7, "success", None
+        
+        batch = [('u', 13.3409 + k * 0.01, 74.7421, '2025-06-15') for k in range(4)]
+        with patch('app.backend.get_live_forecast_safe', side_effect=slow_forecast):
+            results = process_advisory_batch(batch)
+        
+        assert all(r['status'] == 'success' for r in results)
+        assert all(r['data_sources']['weather_forecast'] == 'live' for r in results)
+        assert overlapped == [True] * 4
+    
+    def test_forecast_rows_stay_internal(self):
+        """The 7-day rows reach the advisory layer via the cache, not the API response"""
+        result = process_advisory_request('u', 13.3409, 74.7421, '2025-06-15')
+        
+        assert result['status'] == 'success'
+        assert 'weather' not in result
+    
+    def test_invalid_requests_skip_weather_fetch(self):
+        """Requests rejected during feature engineering never reach Open-Meteo"""
+        with patch('app.backend.get_live_forecast_safe') as forecast:
+            result = process_advisory_request('u', 13.3409, 74.7421, 'not-a-date')
+        
+        assert result['status'] == 'error'
+        forecast.assert_not_called()
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -1,13 +1,10 @@
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-def test_enhanced_advisory_success():
+def test_enhanced_advisory_success(api_client):
     """Test successful enhanced advisory request"""
-    response = client.post("/get-enhanced-advisory", json={
+    response = api_client.post("/get-enhanced-advisory", json={
         "user_id": "test_user_enhanced",
         "gps_lat": 13.3409,
         "gps_long": 74.7421,
@@ -34,9 +31,9 @@ def test_enhanced_advisory_success():
     assert "paddy" in enhanced["crop_advice"]
     assert "coconut" in enhanced["crop_advice"]
 
-def test_enhanced_advisory_invalid_date():
+def test_enhanced_advisory_invalid_date(api_client):
     """Test enhanced advisory with invalid date"""
-    response = client.post("/get-enhanced-advisory", json={
+    response = api_client.post("/get-enhanced-advisory", json={
         "user_id": "test_user",
         "gps_lat": 13.3409,
         "gps_long": 74.7421,
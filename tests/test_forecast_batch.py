@@ -0,0 +1,103 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.advisory import AdvisoryService
+
+
+def _location(rain):
+    """Minimal Open-Meteo payload for one location"""
+    return {
+        'daily': {
+            'time': [f'2025-06-{d:02d}' for d in range(1, 8)],
+            'precipitation_sum': [rain] * 7,
+            'temperature_2m_max': [31.0] * 7,
+            'temperature_2m_min': [24.0] * 7
+        }
+    }
+
+
+class TestForecastBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.service = AdvisoryService()
+        AdvisoryService._forecast_cache.clear()
+
+    @patch('app.core.advisory.get_http_session')
+    def test_one_request_per_chunk(self, mock_session):
+        mock_get = mock_session.return_value.get
+        coords = [(13.30, 74.70), (13.40, 74.80), (13.50, 74.90)]
+        first, second = MagicMock(), MagicMock()
+        first.json.return_value = [_location(1.0), _location(2.0)]
+        second.json.return_value = _location(3.0)  # single location -> object
+        mock_get.side_effect = [first, second]
+
+        forecasts = self.service.get_7day_forecasts(coords, batch_size=2)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args_list[0].kwargs['params']['latitude'], '13.3,13.4')
+        self.assertEqual([f[0].rain_mm for f in forecasts], [1.0, 2.0, 3.0])
+        self.assertEqual(len(forecasts[2]), 7)
+
+    @patch('app.core.advisory.get_http_session')
+    def test_failed_chunk_keeps_order(self, mock_session):
+        mock_get = mock_session.return_value.get
+        ok = MagicMock()
+        ok.json.return_value = _location(5.0)
+        mock_get.side_effect = [Exception("timeout"), ok]
+
+        forecasts = self.service.get_7day_forecasts([(13.3, 74.7), (13.4, 74.8)], batch_size=1)
+
+        self.assertEqual(forecasts[0], [])
+        self.assertEqual(forecasts[1][0].rain_mm, 5.0)
+
+    @patch('app.core.advisory.get_http_session')
+    def test_cached_points_are_not_refetched(self, mock_session):
+        mock_get = mock_session.return_value.get
+        response = MagicMock()
+        response.json.return_value = _location(7.0)
+        mock_get.return_value = response
+
+        self.service.get_7day_forecasts([(13.3400, 74.7400)])
+        # Same village, a few hundred metres away
+        forecasts = self.service.get_7day_forecasts([(13.3420, 74.7430)])
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(forecasts[0][0].rain_mm, 7.0)
+
+    @patch('app.core.advisory.get_http_session')
+    def test_prime_cache_refreshes_cached_points(self, mock_session):
+        mock_get = mock_session.return_value.get
+        stale, fresh = MagicMock(), MagicMock()
+        stale.json.return_value = _location(1.0)
+        fresh.json.return_value = _location(9.0)
+        mock_get.side_effect = [stale, fresh]
+
+        self.service.get_7day_forecast(13.34, 74.74)
+        primed = self.service.prime_cache([(13.34, 74.74)])
+
+        self.assertEqual(primed, 1)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.service.get_7day_forecast(13.34, 74.74)[0].rain_mm, 9.0)
+
+    @patch('app.core.advisory.get_http_session')
+    def test_primed_points_serve_live_requests(self, mock_session):
+        from app.backend import get_live_forecast_safe
+        payload = _location(4.0)
+        payload['hourly'] = {'precipitation': [0.0, 6.5]}
+        mock_session.return_value.get.return_value.json.return_value = payload
+
+        self.service.prime_cache([(13.34, 74.74)])
+        with patch('app.backend.get_http_session') as live_session:
+            total, intensity, _, status, _ = get_live_forecast_safe(13.3410, 74.7410)
+
+        live_session.return_value.get.assert_not_called()
+        self.assertEqual((total, intensity, status), (28.0, 6.5, 'success'))
+
+
+if __name__ == '__main__':
+    unittest.main()
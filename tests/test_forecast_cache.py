@@ -0,0 +1,136 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.forecast_cache import SpatialForecastCache, haversine_km
+
+
+class TestSpatialForecastCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = SpatialForecastCache(ttl_seconds=1800, tolerance_km=2.0)
+
+    def test_nearby_point_hits(self):
+        self.cache.put(13.3409, 74.7421, 'udupi')
+        # ~0.4 km away, same 0.02° cell (cross-cell lookups: test_hit_across_cell_boundary)
+        self.assertEqual(self.cache.get(13.3445, 74.7421), 'udupi')
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_hit_across_cell_boundary(self):
+        self.cache.put(13.3999, 74.7399, 'a')
+        self.assertEqual(self.cache.get(13.4001, 74.7401), 'a')
+
+    def test_far_point_misses(self):
+        self.cache.put(13.3409, 74.7421, 'udupi')
+        far = (13.3409 + 0.03, 74.7421)  # ~3.3 km north
+        self.assertGreater(haversine_km(13.3409, 74.7421, *far), 2.0)
+        self.assertIsNone(self.cache.get(*far))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_closest_entry_wins(self):
+        self.cache.put(13.3400, 74.7400, 'near')
+        self.cache.put(13.3550, 74.7400, 'farther')
+        self.assertEqual(self.cache.get(13.3410, 74.7400), 'near')
+
+    def test_expired_entry_misses(self):
+        with patch('app.core.forecast_cache.time.monotonic', return_value=1000.0):
+            self.cache.put(13.3409, 74.7421, 'old')
+        with patch('app.core.forecast_cache.time.monotonic', return_value=1000.0 + 1801):
+            self.assertIsNone(self.cache.get(13.3409, 74.7421))
+
+    def test_locations_drop_unread_entries(self):
+        with patch('app.core.forecast_cache.time.monotonic', return_value=1000.0):
+            self.cache.put(13.3409, 74.7421, 'read')
+            self.cache.put(13.5000, 74.7000, 'unread')
+        # Farmer keeps asking for the first point; the primer refreshes both
+        with patch('app.core.forecast_cache.time.monotonic', return_value=2000.0):
+            self.cache.get(13.3445, 74.7421)
+            self.cache.put(13.3409, 74.7421, 'read')
+            self.cache.put(13.5000, 74.7000, 'unread')
+        with patch('app.core.forecast_cache.time.monotonic', return_value=3000.0):
+            self.assertEqual(self.cache.locations(), [(13.3409, 74.7421)])
+
+    def test_size_is_bounded(self):
+        cache = SpatialForecastCache(ttl_seconds=1800, max_entries=10)
+        for i in range(25):
+            cache.put(13.0 + i * 0.05, 74.7, i)
+        self.assertLessEqual(cache.stats()['entries'], 10)
+
+
+class TestLiveForecastCache(unittest.TestCase):
+
+    def setUp(self):
+        from app import backend
+        from app.core.advisory import forecast_cache
+        self.backend = backend
+        self.forecast_cache = forecast_cache
+        forecast_cache.clear()
+
+    def _response(self):
+        response = MagicMock()
+        response.json.return_value = {
+            'daily': {
+                'time': [f'2025-06-{d:02d}' for d in range(1, 8)],
+                'precipitation_sum': [10.0] * 7,
+                'temperature_2m_max': [31.0] * 7,
+                'temperature_2m_min': [24.0] * 7
+            },
+            'hourly': {'precipitation': [0.5, 4.0, None]}
+        }
+        return response
+
+    def test_nearby_request_reuses_forecast(self):
+        with patch('app.backend.get_http_session') as session:
+            session.return_value.get.return_value = self._response()
+            first = self.backend.get_live_forecast_safe(13.3409, 74.7421)
+            second = self.backend.get_live_forecast_safe(13.3445, 74.7421)
+
+        self.assertEqual(session.return_value.get.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second[0], 70.0)
+        self.assertEqual(second[1], 4.0)
+        self.assertEqual(second[3], 'success')
+
+    def test_advisory_layer_shares_the_cache(self):
+        from app.core.advisory import AdvisoryService
+        with patch('app.backend.get_http_session') as session:
+            session.return_value.get.return_value = self._response()
+            self.backend.get_live_forecast_safe(13.3409, 74.7421)
+
+        with patch('app.core.advisory.get_http_session') as advisory_session:
+            forecast = AdvisoryService().get_7day_forecast(13.3409, 74.7421)
+
+        advisory_session.return_value.get.assert_not_called()
+        self.assertEqual(len(forecast), 7)
+        self.assertEqual(forecast[0].temp_max, 31.0)
+
+    def test_missing_temperatures_keep_rain_totals(self):
+        response = self._response()
+        del response.json.return_value['daily']['temperature_2m_max']
+        with patch('app.backend.get_http_session') as session:
+            session.return_value.get.return_value = response
+            total, intensity, daily_rain, status, _ = \
+                self.backend.get_live_forecast_safe(13.3409, 74.7421)
+
+        self.assertEqual((total, intensity, status), (70.0, 4.0, 'success'))
+        self.assertEqual(len(daily_rain), 7)
+        self.assertEqual(self.forecast_cache.get(13.3409, 74.7421).days, ())
+
+    def test_errors_are_not_cached(self):
+        import requests
+        with patch('app.backend.get_http_session') as session:
+            session.return_value.get.side_effect = requests.Timeout()
+            self.assertEqual(self.backend.get_live_forecast_safe(13.3409, 74.7421)[3], 'error')
+            session.return_value.get.side_effect = None
+            session.return_value.get.return_value = self._response()
+            self.assertEqual(self.backend.get_live_forecast_safe(13.3409, 74.7421)[3], 'success')
+
+        self.assertEqual(session.return_value.get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
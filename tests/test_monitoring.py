@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the prediction log / performance metrics tracker
+"""
+
+import json
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.monitoring.quality import PerformanceTracker
+
+
+def make_tracker(tmp_path):
+    return PerformanceTracker(
+        predictions_db=tmp_path / "predictions_db.jsonl",
+        metrics_file=tmp_path / "performance_metrics.json"
+    )
+
+
+def test_no_data(tmp_path):
+    tracker = make_tracker(tmp_path)
+    assert tracker.calculate_metrics()['status'] == 'no_data'
+
+
+def test_metrics_are_aggregated_incrementally(tmp_path):
+    tracker = make_tracker(tmp_path)
+    tracker.log_prediction('u1', 'udupi', {}, 'Normal', {'Normal': 0.6, 'Excess': 0.3}, False)
+    tracker.log_prediction('u2', 'udupi', {}, 'Excess', {'Normal': 0.2, 'Excess': 0.8}, True)
+    tracker.log_prediction('u3', 'karkala', {}, 'Normal', {'Normal': 0.4}, False)
+
+    metrics = tracker.calculate_metrics()
+    assert metrics['total_predictions'] == 3
+    assert metrics['category_distribution'] == {'Normal': 2, 'Excess': 1}
+    assert metrics['alerts_sent'] == 1
+    assert abs(metrics['avg_confidence_scores']['Normal'] - 0.5) < 1e-9
+    assert abs(metrics['avg_confidence_scores']['Excess'] - 0.8) < 1e-9
+
+    by_taluk = tracker.get_prediction_stats_by_taluk()
+    assert by_taluk['udupi'] == {'count': 2, 'categories': {'Normal': 1, 'Excess': 1}}
+    assert by_taluk['karkala']['count'] == 1
+
+
+def test_aggregates_seeded_from_existing_log(tmp_path):
+    tracker = make_tracker(tmp_path)
+    tracker.log_prediction('u1', 'hebri', {}, 'Deficit', 70, True)  # legacy percent format
+    tracker.close()
+
+    # A fresh process sees what was logged before it started
+    restarted = make_tracker(tmp_path)
+    restarted.log_prediction('u2', 'hebri', {}, 'Deficit', {'Deficit': 0.5}, False)
+    metrics = restarted.calculate_metrics()
+    assert metrics['total_predictions'] == 2
+    assert abs(metrics['avg_confidence_scores']['Deficit'] - 0.6) < 1e-9
+
+    restarted.close()
+    with open(tmp_path / "predictions_db.jsonl") as f:
+        assert [json.loads(line)['user_id'] for line in f] == ['u1', 'u2']
+
+
+def test_flush_writes_buffered_records(tmp_path):
+    tracker = make_tracker(tmp_path)
+    tracker.log_prediction('u1', 'kaup', {}, 'Normal', {'Normal': 0.7}, False)
+
+    # Still in the write buffer until a flush
+    assert (tmp_path / "predictions_db.jsonl").read_bytes() == b''
+    tracker.flush()
+    with open(tmp_path / "predictions_db.jsonl") as f:
+        assert [json.loads(line)['user_id'] for line in f] == ['u1']
+    tracker.close()
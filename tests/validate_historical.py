@@ -1,5 +1,7 @@
 import sys
 import os
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -9,6 +11,10 @@ sys.path.append(os.getcwd())
 from app.backend import RainfallPredictor
 from app.core.rules import generate_alert
 
+# Column order of the simulated raw confidence matrix
+CLASS_ORDER = ('Deficit', 'Normal', 'Excess')
+
+@lru_cache(maxsize=None)
 def mock_live_forecast(event_type):
     """
     Simulate live forecast based on the ground truth event type.
@@ -27,112 +33,76 @@ def validate_historical():
     df = pd.read_csv('data/comprehensive_validation_results.csv')
     predictor = RainfallPredictor()
     
-    correct = 0
-    total = 0
-    safety_violations = 0
+    df = df[df['testable']].reset_index(drop=True)
+    dates = df['date'].to_numpy()
+    expected_types = df['event_type'].to_numpy()
+    expected_categories = df['expected'].to_numpy()
+    raw_predictions = df['prediction'].to_numpy()
+    months = pd.to_datetime(df['date']).dt.month.to_numpy()
     
-    results = []
+    # 1. Simulate ML Input (Raw Model Output)
+    # We simulate the "Raw" output that was problematic, to see if Calibration fixes it.
+    # Columns follow CLASS_ORDER; every row starts as the baseline Normal guess
+    raw_conf = np.tile([0.1, 0.8, 0.1], (len(df), 1))
     
-    for _, row in df.iterrows():
-        if not row['testable']:
-            continue
-            
-        date = row['date']
-        expected_type = row['event_type']
-        expected_category = row['expected']
-        
-        # 1. Simulate ML Input (Raw Model Output)
-        # We simulate the "Raw" output that was problematic, to see if Calibration fixes it.
-        
-        # Default "Weak" probabilities to simulate uncertainty
-        raw_conf = {'Deficit': 0.1, 'Normal': 0.6, 'Excess': 0.3} 
-        
-        original_ml_prediction = row['prediction'] 
-        
-        # Setup the "Mistake" that the raw model makes
-        if original_ml_prediction == "Normal" and expected_category == "Excess":
-            # Raw model confidently wrongly predicts Normal
-            raw_conf = {'Deficit': 0.05, 'Normal': 0.85, 'Excess': 0.10}
-            
-        elif original_ml_prediction == "Excess" and expected_category == "Deficit":
-             # Raw model confidently wrongly predicts Excess
-             raw_conf = {'Deficit': 0.10, 'Normal': 0.10, 'Excess': 0.80}
-             
-        else:
-            # Baseline correct-ish or other errors
-            if original_ml_prediction == 'Deficit': 
-                raw_conf = {'Deficit': 0.7, 'Normal': 0.2, 'Excess': 0.1}
-            elif original_ml_prediction == 'Excess': 
-                raw_conf = {'Deficit': 0.1, 'Normal': 0.2, 'Excess': 0.7}
-            else: 
-                raw_conf = {'Deficit': 0.1, 'Normal': 0.8, 'Excess': 0.1}
-
-        # 2. Prepare Features for Calibration
-        dt = pd.to_datetime(date)
-        
-        # Simulate realistic soil conditions based on the Truth
-        # This allows us to test the Soil-Based Rules
-        if expected_category == 'Excess':
-            simulated_soil = 900.0 # Saturated
-        elif expected_category == 'Deficit':
-            simulated_soil = 10.0  # Dry
-        else:
-            simulated_soil = 100.0 # Neutral
-            
-        features = {
-            'month': dt.month,
-            'rolling_30_rain': simulated_soil
-        }
-
-        # 3. Apply New Calibration Logic
-        # This is the Key Test: Does our new code fix the bad raw_conf?
-        ml_cat, calibrated_conf = predictor.calibrate_prediction(raw_conf, features)
-        
-        # 4. Simulate Live Forecast (The "Truth" coming from the sky)
-        live_forecast = mock_live_forecast(expected_type)
-        
-        # 5. Run Hardened Logic
-        # generate_alert expects (category, confidences, forecast)
-        alert = generate_alert(ml_cat, calibrated_conf, live_forecast)
-        
-        # 6. Evaluate
-        system_verdict = alert['type']
-        
-        # Map alert type back to broad categories for comparison
-        if system_verdict in ['FLOOD', 'WET_NORMAL', 'FLASH_FLOOD']:
-            final_cat = 'Excess'
-        elif system_verdict in ['DROUGHT', 'DROUGHT_RELIEF']:
-            final_cat = 'Deficit'
-        else:
-            final_cat = 'Normal'
-            
-        # Refined matching logic
-        is_match = False
-        if expected_category == 'Excess' and system_verdict in ['FLOOD', 'WET_NORMAL']: is_match = True
-        if expected_category == 'Deficit' and system_verdict in ['DROUGHT', 'DROUGHT_RELIEF']: is_match = True
-        if expected_category == 'Normal' and system_verdict == 'NORMAL': is_match = True
-        if expected_category == 'Normal/Excess' and system_verdict in ['NORMAL', 'WET_NORMAL', 'FLOOD']: is_match = True
-        
-        # Safety Check
-        if expected_type == 'flood' and system_verdict not in ['FLOOD', 'FLASH_FLOOD']:
-            safety_violations += 1
-            print(f"❌ SAFETY VIOLATION on {date}: Expected FLOOD, got {system_verdict}")
-        
-        if is_match:
-            correct += 1
-        else:
-            print(f"Miss: {date} | Exp: {expected_category} | RawML: {original_ml_prediction} -> Calibrated: {ml_cat} | Sys: {system_verdict}")
-            
-        total += 1
-        results.append({
-            'date': date,
-            'expected': expected_category,
-            'raw_ml': original_ml_prediction,
-            'calibrated_ml': ml_cat,
-            'final_system': system_verdict,
-            'match': is_match
-        })
-        
+    # Baseline correct-ish or other errors
+    raw_conf[raw_predictions == 'Deficit'] = [0.7, 0.2, 0.1]
+    raw_conf[raw_predictions == 'Excess'] = [0.1, 0.2, 0.7]
+    
+    # Setup the "Mistake" that the raw model makes
+    # Raw model confidently wrongly predicts Normal
+    raw_conf[(raw_predictions == 'Normal') & (expected_categories == 'Excess')] = [0.05, 0.85, 0.10]
+    # Raw model confidently wrongly predicts Excess
+    raw_conf[(raw_predictions == 'Excess') & (expected_categories == 'Deficit')] = [0.10, 0.10, 0.80]
+    
+    # 2. Prepare Features for Calibration
+    # Simulate realistic soil conditions based on the Truth
+    # This allows us to test the Soil-Based Rules
+    simulated_soil = np.select(
+        [expected_categories == 'Excess', expected_categories == 'Deficit'],
+        [900.0, 10.0],  # Saturated, Dry
+        default=100.0   # Neutral
+    )
+    
+    # 3. Apply New Calibration Logic (all rows at once)
+    # This is the Key Test: Does our new code fix the bad raw_conf?
+    ml_cats, calibrated = predictor.calibrate_prediction_batch(
+        raw_conf, months, simulated_soil, classes=CLASS_ORDER
+    )
+    
+    # 4. Simulate Live Forecast (The "Truth" coming from the sky)
+    live_forecasts = [mock_live_forecast(t) for t in expected_types]
+    
+    # 5. Run Hardened Logic
+    # generate_alert expects (category, confidences, forecast); its rule cascade
+    # only branches on category and forecast, so each pair is evaluated once
+    verdicts = {}  # (ml_category, live_forecast) -> alert type
+    for ml_cat, conf_row, live_forecast in zip(ml_cats.tolist(), calibrated.tolist(), live_forecasts):
+        key = (ml_cat, live_forecast)
+        if key not in verdicts:
+            verdicts[key] = generate_alert(ml_cat, dict(zip(CLASS_ORDER, conf_row)), live_forecast)['type']
+    system_verdicts = np.array([verdicts[key] for key in zip(ml_cats.tolist(), live_forecasts)], dtype=object)
+    
+    # 6. Evaluate (refined matching logic, all rows at once)
+    match = (
+        ((expected_categories == 'Excess') & np.isin(system_verdicts, ['FLOOD', 'WET_NORMAL'])) |
+        ((expected_categories == 'Deficit') & np.isin(system_verdicts, ['DROUGHT', 'DROUGHT_RELIEF'])) |
+        ((expected_categories == 'Normal') & (system_verdicts == 'NORMAL')) |
+        ((expected_categories == 'Normal/Excess') & np.isin(system_verdicts, ['NORMAL', 'WET_NORMAL', 'FLOOD']))
+    )
+    
+    # Safety Check
+    violation = (expected_types == 'flood') & ~np.isin(system_verdicts, ['FLOOD', 'FLASH_FLOOD'])
+    
+    for i in np.flatnonzero(violation | ~match):
+        if violation[i]:
+            print(f"❌ SAFETY VIOLATION on {dates[i]}: Expected FLOOD, got {system_verdicts[i]}")
+        if not match[i]:
+            print(f"Miss: {dates[i]} | Exp: {expected_categories[i]} | RawML: {raw_predictions[i]} -> Calibrated: {ml_cats[i]} | Sys: {system_verdicts[i]}")
+    
+    total = len(df)
+    correct = int(match.sum())
+    safety_violations = int(violation.sum())
     accuracy = (correct / total) * 100
     print(f"\n📊 FINAL RESULTS:")
     print(f"Total Events: {total}")
@@ -2,27 +2,21 @@
 import sys
 import os
 import pandas as pd
-from datetime import datetime
-import contextlib
-import io
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.backend import process_advisory_request
 from app.core.advisory import AdvisoryService
+from app.core.rules import generate_alert
 
-
-import sys
-import os
-import pandas as pd
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from app.backend import process_advisory_request
+# Mock inputs per event type: (7-day forecast mm, ML category, 14-day rain history)
+EVENT_PROFILES = {
+    'flood': (150.0, 'Excess', (10.0,) * 13 + (100.0,)),     # >100mm triggers flood; saturated soil
+    'heavy_rain': (80.0, 'Excess', (5.0,) * 14),             # >64mm triggers heavy rain alert
+    'excess_seasonal': (20.0, 'Excess', (20.0,) * 14),       # Wet soil
+    'dry_period': (0.0, 'Deficit', (0.0,) * 14),             # Or Normal depending on severity
+}
+DEFAULT_PROFILE = (0.0, 'Normal', (0.0,) * 14)
 
 def validate_real_data():
     data_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'imd_official_measurements.csv')
@@ -31,130 +25,54 @@ def validate_real_data():
     print(f"--- VALIDATING AGAINST {len(df)} REAL DATA POINTS (IMD) ---")
     
     success_count = 0
-    total_count = 0
-    
-    # We need to patch the backend's internal methods or the classes it uses
-    # Since process_advisory_request instantiates classes if not provided, 
-    # we can pass mocks or patch the class methods.
+    total_count = len(df)
+    service = AdvisoryService()
     
-    for idx, row in df.iterrows():
-        total_count += 1
-        date_str = row['date']
-        expected = row['expected_prediction']
-        event = row['event_type']
-        note = row['note']
+    for row in df.itertuples(index=False):
+        date_str = row.date
+        expected = row.expected_prediction
+        event = row.event_type
+        note = row.note
         
         # Determine Mock Values based on Event Type
-        mock_forecast = 0.0
-        mock_ml_category = 'Normal'
-        mock_history = [0.0] * 14
+        mock_forecast, mock_ml_category, mock_history = EVENT_PROFILES.get(event, DEFAULT_PROFILE)
         
-        if event == 'flood':
-            mock_forecast = 150.0  # >100mm triggers flood
-            mock_ml_category = 'Excess'
-            mock_history = [10.0] * 13 + [100.0] # Saturated soil
-            
-        elif event == 'heavy_rain':
-            mock_forecast = 80.0   # >64mm triggers heavy rain alert
-            mock_ml_category = 'Excess'
-            mock_history = [5.0] * 14
-            
-        elif event == 'excess_seasonal':
-            mock_forecast = 20.0
-            mock_ml_category = 'Excess' 
-            mock_history = [20.0] * 14 # Wet soil
-            
-        elif event == 'dry_period':
-            mock_forecast = 0.0
-            mock_ml_category = 'Deficit' # Or Normal depending on severity
-            mock_history = [0.0] * 14
-        
-        # Patching Live Forecast and optionally ML prediction
         # We want to verify that GIVEN the correct forecast/history, the system produces the correct Output.
-        
-        with patch('app.backend.FeatureEngineer.get_recent_rainfall_list', return_value=mock_history), \
-             patch('app.backend.RainfallPredictor.predict') as mock_predict, \
-             patch('app.backend.get_live_forecast_safe') as mock_forecast_func:
+        # The rule engine and advisory are called directly with the mock values, so no backend
+        # fetch (forecast, history, ML) runs and nothing needs patching.
+        try:
+            # Generate Alert Logic Check
+            alert = generate_alert(mock_ml_category, 85, mock_forecast)
             
-            # Setup Forecast Mock
-            mock_forecast_func.return_value = (mock_forecast, 0.0, 'success', None)
+            # Advisory Check
+            risk_level = service.get_risk_level(mock_ml_category, 85)
             
-            # Setup ML mock
-            # We assume ML model is correct for the validation of SYSTEM logic
-            # Or we can let the real model run if we trust the historical data. 
-            # But here we want to validate the "Rule Engine" and "Advisory" mostly.
-            # Let's mock the ML output to be consistent with the ground truth event for "100% check".
+            # Soil Moisture Check
+            sm_status, _ = service.estimate_soil_moisture(mock_history)
             
-            mock_predict.return_value = (mock_ml_category, {mock_ml_category: 0.85}, {'uncertainty': 'low'})
+            # Comprehensive Logic Verification
+            is_valid = True
             
-            # Run System
-            # Note: _get_live_forecast is a method of BackendService if we refactored, 
-            # but currently process_advisory_request uses a standalone or helper.
-            # Wait, `process_advisory_request` in `backend.py` calls `get_live_forecast`?
-            # Let's double check `backend.py` structure.
-            # It seems `feature_engineer` fetches weather? 
-            # Actually `process_advisory_request` calls `live_rain = 0.0` then `weather_data`.
-            # Let's check `backend.py` again to be sure where to patch.
-            
-            # Re-reading backend.py shows:
-            # live_rain = 0.0
-            # ...
-            # if USE_LIVE_WEATHER: ... live_rain = service.get_forecast(...)
-            
-            # We will use a mock logic:
-            
-            try:
-                # We need to patch where `live_rain` comes from.
-                # In `backend.py`, it seems it might be `openmeteo_service.get_forecast` or similar?
-                # or `advisory_service.get_forecast`?
-                # Actually, `process_advisory_request` doesn't seemingly calculate `live_rain` via a class method we can easily patch 
-                # unless we see the code.
-                # Based on previous `view_file`, `process_advisory_request` does:
-                # `live_forecast_7day_mm` is passed to `build_farmer_response`.
-                
-                # Let's assumes we can patch `app.backend.get_live_forecast_from_api` (if it exists)
-                # Or better, we analyze the output.
+            if event == 'flood':
+                if alert['type'] != 'FLOOD': is_valid = False
+                if sm_status != 'saturated': is_valid = False
                 
-                # Actually, to guarantee 100% logic validation, let's call `build_farmer_response` directly!
-                # This bypasses the "fetching" and tests the "logic" perfectly.
-                
-                from app.backend import build_farmer_response
-                from app.core.advisory import AdvisoryService
-                from app.core.rules import generate_alert
+            elif event == 'heavy_rain':
+                 if risk_level[0] != 'HIGH': is_valid = False
                  
-                # Generate Alert Logic Check
-                alert = generate_alert(mock_ml_category, 85, mock_forecast)
-                
-                # Advisory Check
-                service = AdvisoryService()
-                risk_level = service.get_risk_level(mock_ml_category, 85)
-                
-                # Soil Moisture Check
-                sm_status, _ = service.estimate_soil_moisture(mock_history)
-                
-                # Comprehensive Logic Verification
-                is_valid = True
-                
-                if event == 'flood':
-                    if alert['type'] != 'FLOOD': is_valid = False
-                    if sm_status != 'saturated': is_valid = False
-                    
-                elif event == 'heavy_rain':
-                     if risk_level[0] != 'HIGH': is_valid = False
-                     
-                elif event == 'dry_period':
-                     if sm_status != 'dry' and sm_status != 'extremely_dry': is_valid = False
-                     # category matches mock
-                
-                if is_valid:
-                    success_count += 1
-                    print(f"✅ {date_str} [{event}] - Validated")
-                else:
-                    print(f"❌ {date_str} [{event}] - Failed Logic")
-                    print(f"   Alert: {alert['type']}, SM: {sm_status}")
+            elif event == 'dry_period':
+                 if sm_status != 'dry' and sm_status != 'extremely_dry': is_valid = False
+                 # category matches mock
+            
+            if is_valid:
+                success_count += 1
+                print(f"✅ {date_str} [{event}] - Validated")
+            else:
+                print(f"❌ {date_str} [{event}] - Failed Logic")
+                print(f"   Alert: {alert['type']}, SM: {sm_status}")
 
-            except Exception as e:
-                print(f"❌ {date_str} - Exception: {e}")
+        except Exception as e:
+            print(f"❌ {date_str} - Exception: {e}")
 
     print(f"\nAccuracy: {success_count}/{total_count} ({(success_count/total_count)*100:.1f}%)")
     if success_count == total_count:
@@ -164,6 +82,3 @@ def validate_real_data():
 
 if __name__ == "__main__":
     validate_real_data()
-
-if __name__ == "__main__":
-    validate_real_data()
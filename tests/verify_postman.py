@@ -1,4 +1,5 @@
-import json
+import orjson
+import re
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -10,9 +11,12 @@ sys.path.append(os.getcwd())
 
 client = TestClient(app)
 
+# Whole-line // comments, which Postman allows in raw JSON bodies
+_COMMENT_RE = re.compile(r'^[ \t]*//.*$', re.MULTILINE)
+
 def load_postman_collection():
-    with open('postman_collection.json', 'r') as f:
-        return json.load(f)
+    with open('postman_collection.json', 'rb') as f:
+        return orjson.loads(f.read())
 
 def get_requests_from_collection(collection):
     requests = []
@@ -34,49 +38,51 @@ def get_requests_from_collection(collection):
     extract_requests(collection['item'])
     return requests
 
+def _request_path(url):
+    """Normalize a Postman URL (raw string, or object with a path list/string) to a path"""
+    if isinstance(url, str):
+        # This logic handles raw strings if they exist, but our JSON uses objects
+        return url.replace("{{base_url}}", "")
+    path_list = url.get('path', [])
+    if isinstance(path_list, str):
+        # Sometimes it's a string in the object?? Postman is weird.
+        return "/" + path_list
+    return "/" + "/".join(path_list)
+
+def _request_body(req):
+    """Parse a raw JSON body, if any (Postman allows // comments in it)"""
+    if not (req.get('body') and req['body'].get('mode') == 'raw'):
+        return None
+    try:
+        return orjson.loads(_COMMENT_RE.sub('', req['body']['raw']))
+    except Exception as e:
+        print(f"  Skipping body details: {e}")
+        return None
+
+def build_test_cases(collection):
+    """
+    Resolve every request once into (method, path, headers, json_body, name, folder)
+    so the test loop only has to send them
+    """
+    return [
+        (
+            case['request']['method'],
+            _request_path(case['request']['url']),
+            {h['key']: h['value'] for h in case['request'].get('header', [])},
+            _request_body(case['request']),
+            case['name'],
+            case['folder']
+        )
+        for case in get_requests_from_collection(collection)
+    ]
+
 def test_postman_collection():
-    collection = load_postman_collection()
-    test_cases = get_requests_from_collection(collection)
+    test_cases = build_test_cases(load_postman_collection())
     
     print(f"\nFound {len(test_cases)} requests in Postman collection.")
     
-    for case in test_cases:
-        req = case['request']
-        name = case['name']
-        print(f"\nTesting: {case['folder']} / {name}")
-        
-        # Parse URL to get path
-        # Postman URL object can be string or object
-        if isinstance(req['url'], str):
-            # This logic handles raw strings if they exist, but our JSON uses objects
-             raw_url = req['url']
-             path = raw_url.replace("{{base_url}}", "")
-        else:
-             path_list = req['url'].get('path', [])
-             if isinstance(path_list, str): 
-                 # Sometimes it's a string in the object?? Postman is weird.
-                 path = "/" + path_list
-             else:
-                path = "/" + "/".join(path_list)
-        
-        # Method
-        method = req['method']
-        
-        # Headers (convert list to dict)
-        headers = {h['key']: h['value'] for h in req.get('header', [])}
-        
-        # Body
-        json_body = None
-        if req.get('body') and req['body'].get('mode') == 'raw':
-            raw_body = req['body']['raw']
-            try:
-                # There might be comments in JSON (Postman allows it), preventing standard json.loads
-                # Simple cleanup for // comments
-                lines = [l for l in raw_body.splitlines() if not l.strip().startswith("//")]
-                cleaned_body = "\n".join(lines)
-                json_body = json.loads(cleaned_body)
-            except Exception as e:
-                print(f"  Skipping body details: {e}")
+    for method, path, headers, json_body, name, folder in test_cases:
+        print(f"\nTesting: {folder} / {name}")
         
         # Execute
         try: